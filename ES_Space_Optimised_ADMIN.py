@@ -3,59 +3,699 @@ import streamlit as st
 import requests
 import uuid
 import json
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
 import os
 import time
 import functools
+import re
+import threading
+from collections import Counter, OrderedDict, deque
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor, as_completed, wait
+import hashlib
+import csv
+import gzip
+import io
+import tempfile
+import http.cookiejar
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit
+from urllib3.util.retry import Retry
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
 from dotenv import load_dotenv
 load_dotenv()
  
  
 def track_time(func):
+    # Feeds call latency and failures into the metrics registry; a helper
+    # counts as failed when it raises or returns the (False, error) convention
     @functools.wraps(func)
     def wrapper(*args, **kwargs):
         start_time = time.perf_counter()
-        result = func(*args, **kwargs)
-        end_time = time.perf_counter()
-        duration = end_time - start_time
-        print(f"{func.__name__} call duration: {duration:.4f} seconds")
-        return result
+        failed = True
+        try:
+            result = func(*args, **kwargs)
+            failed = isinstance(result, tuple) and len(result) == 2 and result[0] is False
+            return result
+        finally:
+            duration = time.perf_counter() - start_time
+            get_metrics_registry().observe("call", func.__name__, duration, error=failed)
+            profiler = getattr(_profiling, "profiler", None)
+            if profiler is not None:
+                profiler.record_backend(func.__name__, duration)
     return wrapper
+
+# Per-rerun render profiling - off unless RENDER_PROFILING is set or an admin enables it
+RENDER_PROFILING = os.getenv("RENDER_PROFILING", "false").lower() == "true"
+RENDER_PROFILE_HISTORY = int(os.getenv("RENDER_PROFILE_HISTORY", "50"))
+_profiling = threading.local()
+
+class RenderProfiler:
+    # Splits a rerun's wall time into script sections. checkpoint(name) charges
+    # the time since the previous checkpoint to name; section(name) times a
+    # nested block (e.g. feedback widgets inside the history loop) separately.
+    # Backend calls made on the script thread are reported via track_time.
+    def __init__(self, history):
+        self.enabled = RENDER_PROFILING
+        self.runs = deque(maxlen=history)
+        self._current = None
+
+    def start_run(self):
+        # A rerun cut short by st.rerun()/st.stop() never reaches finish_run
+        if self._current is not None:
+            self._close(interrupted=True)
+        _profiling.profiler = self if self.enabled else None
+        if not self.enabled:
+            return
+        now = time.perf_counter()
+        self._current = {
+            "started_at": datetime.now().isoformat(timespec="seconds"),
+            "started": now,
+            "last_checkpoint": now,
+            "sections": {},
+            "nested": {},
+            "backend": {},
+        }
+
+    def _add(self, group, name, duration):
+        if self._current is not None:
+            bucket = self._current[group]
+            bucket[name] = bucket.get(name, 0.0) + duration
+
+    def checkpoint(self, name):
+        if self._current is None:
+            return
+        now = time.perf_counter()
+        self._add("sections", name, now - self._current["last_checkpoint"])
+        self._current["last_checkpoint"] = now
+
+    @contextmanager
+    def section(self, name):
+        start_time = time.perf_counter()
+        try:
+            yield
+        finally:
+            self._add("nested", name, time.perf_counter() - start_time)
+
+    def record_backend(self, name, duration):
+        self._add("backend", name, duration)
+
+    def finish_run(self):
+        if self._current is not None:
+            self._close(interrupted=False)
+
+    def _close(self, interrupted):
+        run, self._current = self._current, None
+        to_ms = lambda timings: {name: round(duration * 1000, 1) for name, duration in timings.items()}
+        self.runs.append({
+            "started_at": run["started_at"],
+            "total_ms": round((time.perf_counter() - run["started"]) * 1000, 1),
+            "interrupted": interrupted,
+            "sections": to_ms(run["sections"]),
+            "nested": to_ms(run["nested"]),
+            "backend": to_ms(run["backend"]),
+        })
+
+    def to_json(self):
+        return json.dumps(list(self.runs), indent=2)
+
+def get_render_profiler():
+    if "render_profiler" not in st.session_state:
+        st.session_state["render_profiler"] = RenderProfiler(RENDER_PROFILE_HISTORY)
+    return st.session_state["render_profiler"]
+
+# Metrics export - METRICS_PORT serves /metrics over HTTP, METRICS_EXPORT_PATH
+# is rewritten every METRICS_EXPORT_INTERVAL seconds (textfile collector style)
+METRICS_HOST = os.getenv("METRICS_HOST", "127.0.0.1")
+METRICS_PORT = int(os.getenv("METRICS_PORT", "0"))
+METRICS_EXPORT_PATH = os.getenv("METRICS_EXPORT_PATH", "")
+METRICS_EXPORT_INTERVAL = int(os.getenv("METRICS_EXPORT_INTERVAL", "30"))
+METRICS_SAMPLE_WINDOW = int(os.getenv("METRICS_SAMPLE_WINDOW", "2048"))
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0)
+
+class MetricsRegistry:
+    # Per-series latency histograms, counts, error counts and response bytes.
+    # Series are ("call", helper name) from track_time and ("http", "METHOD /path")
+    # from api_request. Percentiles come from a sliding window of recent samples.
+    def __init__(self, window):
+        self.window = window
+        self._lock = threading.Lock()
+        self._series = {}
+
+    def observe(self, kind, name, duration, error=False, nbytes=0):
+        with self._lock:
+            series = self._series.get((kind, name))
+            if series is None:
+                series = {
+                    "count": 0,
+                    "errors": 0,
+                    "bytes": 0,
+                    "sum": 0.0,
+                    "buckets": [0] * len(LATENCY_BUCKETS),
+                    "samples": deque(maxlen=self.window),
+                }
+                self._series[(kind, name)] = series
+            series["count"] += 1
+            series["sum"] += duration
+            series["errors"] += 1 if error else 0
+            series["bytes"] += nbytes
+            for i, bound in enumerate(LATENCY_BUCKETS):
+                if duration <= bound:
+                    series["buckets"][i] += 1
+            series["samples"].append(duration)
+
+    def _snapshot(self):
+        with self._lock:
+            return [
+                (kind, name, dict(series, buckets=list(series["buckets"]), samples=sorted(series["samples"])))
+                for (kind, name), series in sorted(self._series.items())
+            ]
+
+    @staticmethod
+    def _percentile(samples, q):
+        if not samples:
+            return 0.0
+        return samples[min(len(samples) - 1, int(q * len(samples)))]
+
+    def summary(self):
+        rows = []
+        for kind, name, series in self._snapshot():
+            samples = series["samples"]
+            rows.append({
+                "kind": kind,
+                "name": name,
+                "count": series["count"],
+                "errors": series["errors"],
+                "p50_ms": round(self._percentile(samples, 0.50) * 1000, 1),
+                "p95_ms": round(self._percentile(samples, 0.95) * 1000, 1),
+                "p99_ms": round(self._percentile(samples, 0.99) * 1000, 1),
+                "total_s": round(series["sum"], 3),
+                "bytes": series["bytes"],
+            })
+        return rows
+
+    def render_prometheus(self):
+        metric_names = {"call": "gsc_frontend_call", "http": "gsc_frontend_http_request"}
+        label_names = {"call": "function", "http": "endpoint"}
+        lines = []
+        for kind in ("call", "http"):
+            metric = metric_names[kind]
+            series_list = [(name, series) for k, name, series in self._snapshot() if k == kind]
+            if not series_list:
+                continue
+            lines.append(f"# TYPE {metric}_duration_seconds histogram")
+            for name, series in series_list:
+                label = f'{label_names[kind]}="{name}"'
+                for bound, bucket_count in zip(LATENCY_BUCKETS, series["buckets"]):
+                    lines.append(f'{metric}_duration_seconds_bucket{{{label},le="{bound}"}} {bucket_count}')
+                lines.append(f'{metric}_duration_seconds_bucket{{{label},le="+Inf"}} {series["count"]}')
+                lines.append(f'{metric}_duration_seconds_sum{{{label}}} {series["sum"]:.6f}')
+                lines.append(f'{metric}_duration_seconds_count{{{label}}} {series["count"]}')
+            lines.append(f"# TYPE {metric}_duration_quantile_seconds gauge")
+            for name, series in series_list:
+                label = f'{label_names[kind]}="{name}"'
+                for q in (0.5, 0.95, 0.99):
+                    lines.append(f'{metric}_duration_quantile_seconds{{{label},quantile="{q}"}} {self._percentile(series["samples"], q):.6f}')
+            lines.append(f"# TYPE {metric}_errors_total counter")
+            for name, series in series_list:
+                lines.append(f'{metric}_errors_total{{{label_names[kind]}="{name}"}} {series["errors"]}')
+            if kind == "http":
+                lines.append(f"# TYPE {metric}_response_bytes_total counter")
+                for name, series in series_list:
+                    lines.append(f'{metric}_response_bytes_total{{{label_names[kind]}="{name}"}} {series["bytes"]}')
+        return "\n".join(lines) + "\n"
+
+    def export_to_file(self, path):
+        # Write-then-rename so scrapers never read a half-written file
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(self.render_prometheus())
+        os.replace(tmp_path, path)
+
+@st.cache_resource(show_spinner=False)
+def get_metrics_registry():
+    return MetricsRegistry(METRICS_SAMPLE_WINDOW)
+
+@st.cache_resource(show_spinner=False)
+def start_metrics_exporters():
+    registry = get_metrics_registry()
+
+    if METRICS_PORT:
+        class MetricsHandler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split("?")[0] != "/metrics":
+                    self.send_error(404)
+                    return
+                body = registry.render_prometheus().encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "text/plain; version=0.0.4")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        # Another process (e.g. a second Streamlit server) may hold the port;
+        # the app keeps running without the endpoint rather than failing every rerun
+        try:
+            server = ThreadingHTTPServer((METRICS_HOST, METRICS_PORT), MetricsHandler)
+        except OSError as e:
+            print(f"Metrics endpoint on {METRICS_HOST}:{METRICS_PORT} not started: {e}")
+        else:
+            threading.Thread(target=server.serve_forever, name="metrics-http", daemon=True).start()
+
+    if METRICS_EXPORT_PATH:
+        def export_loop():
+            while True:
+                time.sleep(METRICS_EXPORT_INTERVAL)
+                try:
+                    registry.export_to_file(METRICS_EXPORT_PATH)
+                except OSError as e:
+                    print(f"Metrics export to {METRICS_EXPORT_PATH} failed: {e}")
+
+        threading.Thread(target=export_loop, name="metrics-file", daemon=True).start()
+    return True
+
+_ENDPOINT_ID_SEGMENT = re.compile(r"^(\d+|[0-9a-fA-F-]{16,})$")
+
+def endpoint_label(method, url):
+    # "GET /admin/documents/123/toggle-active" -> "GET /admin/documents/{id}/toggle-active"
+    # keeps the series count bounded no matter how many ids are touched
+    segments = ["{id}" if _ENDPOINT_ID_SEGMENT.match(seg) else seg for seg in urlsplit(url).path.split("/")]
+    return f"{method.upper()} {'/'.join(segments)}"
  
 # API_BASE_URL = os.getenv("API_BASE_URL", "http://localhost:8000/chat")
 API_BASE_URL = "http://localhost:5555"
- 
+
+# Connection pool sizing - pool_connections is the number of hosts kept pooled,
+# pool_maxsize the number of keep-alive connections per host
+HTTP_POOL_CONNECTIONS = int(os.getenv("HTTP_POOL_CONNECTIONS", "10"))
+HTTP_POOL_MAXSIZE = int(os.getenv("HTTP_POOL_MAXSIZE", "50"))
+HTTP_POOL_BLOCK = os.getenv("HTTP_POOL_BLOCK", "false").lower() == "true"
+
+# Uniform request policy for every backend call made through api_request()
+API_TIMEOUT = int(os.getenv("API_TIMEOUT", "60"))
+CHAT_TIMEOUT = int(os.getenv("CHAT_TIMEOUT", "120"))
+CHAT_STREAMING = os.getenv("CHAT_STREAMING", "true").lower() == "true"
+CHAT_STREAM_PATH = os.getenv("CHAT_STREAM_PATH", "/chat/stream")
+CHAT_WORKERS = int(os.getenv("CHAT_WORKERS", "32"))
+CHAT_POLL_INTERVAL = float(os.getenv("CHAT_POLL_INTERVAL", "0.5"))
+PREFETCH_WORKERS = int(os.getenv("PREFETCH_WORKERS", "32"))
+PREFETCH_DEADLINE = float(os.getenv("PREFETCH_DEADLINE", "10"))
+DOC_PAGE_SIZE = int(os.getenv("DOC_PAGE_SIZE", "25"))
+DOC_GRID_PAGE_SIZES = [25, 50, 100, 250, 500]
+DOC_GRID_HEIGHT = int(os.getenv("DOC_GRID_HEIGHT", "600"))
+BULK_CONCURRENCY = int(os.getenv("BULK_CONCURRENCY", "8"))
+DOC_PAGE_CACHE_SIZE = int(os.getenv("DOC_PAGE_CACHE_SIZE", "8"))
+DOC_SYNC_BATCH = int(os.getenv("DOC_SYNC_BATCH", "500"))
+DOC_SYNC_MAX_BATCHES = int(os.getenv("DOC_SYNC_MAX_BATCHES", "1000"))
+DOC_FULL_SYNC_INTERVAL = int(os.getenv("DOC_FULL_SYNC_INTERVAL", "3600"))
+DOC_WATCH_MIN_INTERVAL = float(os.getenv("DOC_WATCH_MIN_INTERVAL", "2"))
+DOC_WATCH_MAX_INTERVAL = float(os.getenv("DOC_WATCH_MAX_INTERVAL", "60"))
+DOC_WATCH_STATUSES = ("processing", "pending")
+# Local catalogue sort options: label -> (column, descending)
+DOC_SORT_OPTIONS = {
+    "Updated (newest)": ("updated", True),
+    "Updated (oldest)": ("updated", False),
+    "Title (A-Z)": ("title", False),
+    "Title (Z-A)": ("title", True),
+    "Status": ("status", False),
+}
+INGEST_CONCURRENCY = int(os.getenv("INGEST_CONCURRENCY", "8"))
+INGEST_MAX_ROWS = int(os.getenv("INGEST_MAX_ROWS", "5000"))
+RESOURCE_NAMES = ["Confluence", "VQD", "Sharepoint", "ServiceNow", "Other"]
+SHARED_CACHE_TTL = int(os.getenv("SHARED_CACHE_TTL", "300"))
+SHARED_CACHE_MAX_ENTRIES = int(os.getenv("SHARED_CACHE_MAX_ENTRIES", "256"))
+ADMIN_SECTIONS = ["📄 Documents", "🛡️ Safety", "➕ Add Document", "📋 Manage Process Owners"]
+# Filter widgets whose values should survive while their section is not rendered
+ADMIN_PERSISTENT_WIDGETS = [
+    "doc_status_filter", "doc_source_filter", "doc_active_filter", "doc_view_mode",
+    "doc_source_mode", "doc_grid_page_size", "doc_search", "doc_sort", "doc_watch_enabled",
+    "safety_categories_filter", "safety_severity_filter", "safety_time_filter", "safety_view_mode",
+    "add_doc_mode",
+]
+SAFETY_LOG_TTL = int(os.getenv("SAFETY_LOG_TTL", "120"))
+SAFETY_PAGE_SIZE = int(os.getenv("SAFETY_PAGE_SIZE", "50"))
+SAFETY_STREAM_PAGE_SIZE = int(os.getenv("SAFETY_STREAM_PAGE_SIZE", "1000"))
+SAFETY_ROLLUP_MAX_LOGS = int(os.getenv("SAFETY_ROLLUP_MAX_LOGS", "200000"))
+# Export formats: label -> (file suffix, mime type)
+EXPORT_FORMATS = {
+    "CSV (gzip)": (".csv.gz", "application/gzip"),
+    "Parquet": (".parquet", "application/vnd.apache.parquet"),
+}
+EXPORT_DIR = os.getenv("EXPORT_DIR") or os.path.join(tempfile.gettempdir(), "admin_exports")
+EXPORT_MAX_AGE = int(os.getenv("EXPORT_MAX_AGE", "3600"))
+SAFETY_EXPORT_COLUMNS = ["id", "chat_id", "categories", "severity", "pii_details", "created_date"]
+DOC_EXPORT_COLUMNS = ["id", "title", "page_url", "source", "indexing_status", "is_active", "last_updated_at", "error_message"]
+# Safety tab time range label -> window length
+SAFETY_TIME_WINDOWS = {
+    "All Time": None,
+    "Last 24h": timedelta(hours=24),
+    "Last 7d": timedelta(days=7),
+    "Last 30d": timedelta(days=30),
+}
+HEALTH_CHECK_TIMEOUT = int(os.getenv("HEALTH_CHECK_TIMEOUT", "5"))
+HEALTH_CHECK_INTERVAL = int(os.getenv("HEALTH_CHECK_INTERVAL", "15"))
+HTTP_RETRY_POLICY = Retry(
+    total=3,
+    backoff_factor=0.5,
+    status_forcelist=(502, 503, 504),
+    # Only idempotent calls are retried on a bad status; POSTs and the
+    # toggle-active PUT are retried on connection failures alone
+    allowed_methods=frozenset({"GET", "HEAD", "OPTIONS", "DELETE"}),
+    raise_on_status=False,
+)
+
+@st.cache_resource(show_spinner=False)
 def get_requests_session():
+    # Shared by every rerun and every user session in this process so the
+    # keep-alive pool survives between requests. Auth travels in per-request
+    # headers only; cookies are never stored so nothing leaks between users.
     session = requests.Session()
     session.headers.update({
         'Connection': 'keep-alive',
         'Accept-Encoding': 'gzip, deflate',
         'User-Agent': 'GSC-ARB-Chatbot-Frontend/1.0'
     })
+    session.cookies.set_policy(http.cookiejar.DefaultCookiePolicy(allowed_domains=[]))
     adapter = requests.adapters.HTTPAdapter(
-        pool_connections=10,
-        pool_maxsize=20,
-        max_retries=3
+        pool_connections=HTTP_POOL_CONNECTIONS,
+        pool_maxsize=HTTP_POOL_MAXSIZE,
+        pool_block=HTTP_POOL_BLOCK,
+        max_retries=HTTP_RETRY_POLICY
     )
     session.mount('http://', adapter)
     session.mount('https://', adapter)
     return session
- 
+
+def get_pool_stats():
+    # Snapshot of the shared pool: one entry per host with connections opened,
+    # requests served and how many of the per-host slots are currently checked out
+    session = get_requests_session()
+    adapters = {id(adapter): adapter for adapter in session.adapters.values()}
+    stats = []
+    for adapter in adapters.values():
+        pools = adapter.poolmanager.pools
+        for key in list(pools.keys()):
+            pool = pools.get(key)
+            if pool is None or pool.pool is None:
+                continue
+            max_per_host = pool.pool.maxsize
+            stats.append({
+                "host": f"{pool.scheme}://{pool.host}:{pool.port}",
+                "connections_opened": pool.num_connections,
+                "requests_served": pool.num_requests,
+                "in_use": max_per_host - pool.pool.qsize(),
+                "max_per_host": max_per_host,
+            })
+    return stats
+
+@st.cache_resource(show_spinner=False)
+def get_request_coalescer():
+    return SingleFlight()
+
+def api_request(method, path, headers=None, timeout=None, **kwargs):
+    # Single client layer for the backend - pooled keep-alive connections,
+    # shared retry policy and a default timeout for every call
+    session = get_requests_session()
+    url = path if path.startswith(("http://", "https://")) else f"{API_BASE_URL}{path}"
+
+    def send():
+        start_time = time.perf_counter()
+        response = None
+        try:
+            response = session.request(method, url, headers=headers, timeout=timeout or API_TIMEOUT, **kwargs)
+            return response
+        finally:
+            if response is None:
+                nbytes = 0
+            elif kwargs.get("stream"):
+                nbytes = int(response.headers.get("Content-Length", 0) or 0)
+            else:
+                nbytes = len(response.content)
+            get_metrics_registry().observe(
+                "http",
+                endpoint_label(method, url),
+                time.perf_counter() - start_time,
+                error=response is None or response.status_code >= 400,
+                nbytes=nbytes,
+            )
+
+    # Identical GETs already in flight (same URL, params and caller identity)
+    # wait for the leader's response instead of hitting the backend again.
+    # Streamed bodies can only be read once, so those are never shared.
+    if method.upper() != "GET" or kwargs.get("stream"):
+        return send()
+    auth_header = (headers or {}).get("Authorization", "")
+    request_key = (
+        url,
+        json.dumps(kwargs.get("params") or {}, sort_keys=True, default=str),
+        hashlib.sha256(auth_header.encode()).hexdigest(),
+    )
+    return get_request_coalescer().do(request_key, send)
+
+def get_coalescing_stats():
+    coalescer = get_request_coalescer()
+    return {"issued": coalescer.leaders, "deduplicated": coalescer.followers}
+
 @track_time
 def test_api_connection():
     try:
-        session = get_requests_session()
-        response = session.get(f"{API_BASE_URL}/health", timeout=60)
+        response = api_request("GET", "/health", timeout=HEALTH_CHECK_TIMEOUT)
         return response.status_code == 200, response.json() if response.status_code == 200 else None
     except requests.exceptions.RequestException as e:
         return False, str(e)
+
+class HealthMonitor:
+    # Probes /health on a daemon thread and keeps the last result so page
+    # renders read a cached status instead of blocking on the backend
+    def __init__(self, interval):
+        self.interval = interval
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._status = {
+            "is_connected": False,
+            "health_data": None,
+            "last_latency": None,
+            "last_checked_at": None,
+            "last_success_at": None,
+        }
+        self._thread = threading.Thread(target=self._run, name="health-monitor", daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        while True:
+            self.probe()
+            self._wake.wait(self.interval)
+            self._wake.clear()
+
+    def probe(self):
+        start_time = time.perf_counter()
+        is_connected, health_data = test_api_connection()
+        latency = time.perf_counter() - start_time
+        now = datetime.now()
+        with self._lock:
+            self._status.update({
+                "is_connected": is_connected,
+                "health_data": health_data,
+                "last_latency": latency,
+                "last_checked_at": now,
+            })
+            if is_connected:
+                self._status["last_success_at"] = now
+        return is_connected, health_data
+
+    def refresh(self):
+        # Ask the monitor thread to probe now instead of waiting out the interval
+        self._wake.set()
+
+    def status(self):
+        with self._lock:
+            return dict(self._status)
+
+@st.cache_resource(show_spinner=False)
+def get_health_monitor():
+    return HealthMonitor(HEALTH_CHECK_INTERVAL)
+
+@st.cache_resource(show_spinner=False)
+def get_prefetch_executor():
+    return ThreadPoolExecutor(max_workers=PREFETCH_WORKERS, thread_name_prefix="prefetch")
+
+class TaskFailure:
+    # run_parallel() result for a task that raised; falsy, so it can never
+    # pass for a successful result
+    def __init__(self, error):
+        self.error = error
+
+    def __bool__(self):
+        return False
+
+def run_parallel(tasks, deadline=PREFETCH_DEADLINE):
+    # Runs independent fetchers concurrently. tasks maps name -> (func, args);
+    # returns name -> result for every task that finished within the deadline,
+    # or a TaskFailure for one that raised. Stragglers keep running in the
+    # pool but are left out of the result.
+    script_ctx = get_script_run_ctx()
+
+    def run_with_ctx(func, args):
+        # Workers borrow the caller's script context so helpers that touch
+        # st.session_state (e.g. validate_user) behave as on the script thread;
+        # pooled threads hand it back afterwards
+        thread = threading.current_thread()
+        previous_ctx = get_script_run_ctx(suppress_warning=True)
+        add_script_run_ctx(thread, script_ctx)
+        try:
+            return func(*args)
+        finally:
+            add_script_run_ctx(thread, previous_ctx)
+
+    executor = get_prefetch_executor()
+    futures = {executor.submit(run_with_ctx, func, args): name for name, (func, args) in tasks.items()}
+    done, _ = wait(futures, timeout=deadline)
+    results = {}
+    for future in done:
+        try:
+            results[futures[future]] = future.result()
+        except Exception as e:
+            results[futures[future]] = TaskFailure(str(e))
+    return results
+
+class SingleFlight:
+    # Collapses concurrent calls for the same key: the first caller (leader)
+    # runs the function, callers arriving meanwhile wait and share its result
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls = {}
+        self.leaders = 0
+        self.followers = 0
+
+    def do(self, key, func):
+        with self._lock:
+            call = self._calls.get(key)
+            is_leader = call is None
+            if is_leader:
+                call = {"done": threading.Event(), "result": None, "error": None}
+                self._calls[key] = call
+                self.leaders += 1
+            else:
+                self.followers += 1
+
+        if is_leader:
+            try:
+                call["result"] = func()
+            except Exception as e:
+                call["error"] = e
+            finally:
+                with self._lock:
+                    self._calls.pop(key, None)
+                call["done"].set()
+        else:
+            call["done"].wait()
+
+        if call["error"] is not None:
+            raise call["error"]
+        return call["result"]
+
+_MISSING = object()
+
+class TTLCache:
+    # Process-wide store for responses that are identical for every user.
+    # Entries expire after their TTL and the least recently used one is evicted
+    # past max_entries. Misses are single-flighted so a burst of sessions
+    # produces one backend call per key. Cached values are shared - treat as read-only.
+    def __init__(self, max_entries):
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()
+        self._flight = SingleFlight()
+        self.hits = 0
+        self.misses = 0
+
+    def _lookup(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return _MISSING
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del self._entries[key]
+                return _MISSING
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key, value, ttl):
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, key):
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def get_or_fetch(self, key, fetch, ttl):
+        # fetch follows the (success, data) convention; only successes are cached
+        value = self._lookup(key)
+        if value is not _MISSING:
+            self.hits += 1
+            return value
+        self.misses += 1
+
+        def load():
+            # An earlier flight may have filled the entry while we queued
+            cached = self._lookup(key)
+            if cached is not _MISSING:
+                return cached
+            result = fetch()
+            if result[0]:
+                self.set(key, result, ttl)
+            return result
+
+        return self._flight.do(key, load)
+
+    def stats(self):
+        with self._lock:
+            entries = len(self._entries)
+        return {
+            "entries": entries,
+            "hits": self.hits,
+            "misses": self.misses,
+            "coalesced": self._flight.followers,
+        }
+
+@st.cache_resource(show_spinner=False)
+def get_shared_cache():
+    return TTLCache(SHARED_CACHE_MAX_ENTRIES)
+
+def shared_cache(ttl=SHARED_CACHE_TTL):
+    # For endpoints that return the same data to every user: one cached result
+    # per function, shared across sessions. Auth headers are not part of the key.
+    # Pass force_refresh=True or call .clear() to drop the cached entry.
+    def decorator(func):
+        cache_key = func.__name__
+
+        @functools.wraps(func)
+        def wrapper(*args, force_refresh=False, **kwargs):
+            cache = get_shared_cache()
+            if force_refresh:
+                cache.invalidate(cache_key)
+            return cache.get_or_fetch(cache_key, lambda: func(*args, **kwargs), ttl)
+
+        wrapper.clear = lambda: get_shared_cache().invalidate(cache_key)
+        return wrapper
+    return decorator
  
+@shared_cache(ttl=SHARED_CACHE_TTL)
 @track_time
 def get_feedback_stats(headers):
-    session = get_requests_session()
     for attempt in range(3):
         try:
-            stats_response = session.get(f"{API_BASE_URL}/chatbot/feedback/stats", headers=headers, timeout=60)
+            stats_response = api_request("GET", "/chatbot/feedback/stats", headers=headers)
             if stats_response.status_code == 200:
                 return True, stats_response.json()
             else:
@@ -69,17 +709,18 @@ def get_feedback_stats(headers):
 @track_time
 def get_user_feedback(headers):
     try:
-        feedback_response = requests.get(f"{API_BASE_URL}/chatbot/feedback/my-feedback", headers=headers, timeout=60)
+        feedback_response = api_request("GET", "/chatbot/feedback/my-feedback", headers=headers)
         if feedback_response.status_code == 200:
             return True, feedback_response.json()
         else:
             return False, f"Status: {feedback_response.status_code}"
     except Exception as e:
         return False, str(e)
+@shared_cache(ttl=SHARED_CACHE_TTL)
 @track_time
 def get_system_status(headers):
     try:
-        status_response = requests.get(f"{API_BASE_URL}/chatbot/system/status", timeout=60, headers=headers)
+        status_response = api_request("GET", "/chatbot/system/status", headers=headers)
         if status_response.status_code == 200:
             return True, status_response.json()
         else:
@@ -95,11 +736,11 @@ def check_admin_access(email):
     admin_emails = [email.strip().lower() for email in admin_emails_str.split(",") if email.strip()]
     return email.lower() in admin_emails
  
+@shared_cache(ttl=SHARED_CACHE_TTL)
 @track_time
 def get_admin_dashboard(headers):
     try:
-        session = get_requests_session()
-        response = session.get(f"{API_BASE_URL}/admin/dashboard", headers=headers, timeout=60)
+        response = api_request("GET", "/admin/dashboard", headers=headers)
         if response.status_code == 200:
             return True, response.json()
         else:
@@ -108,28 +749,787 @@ def get_admin_dashboard(headers):
         return False, str(e)
  
 @track_time
-def get_admin_documents(headers, status_filter=None, source_filter=None):
+def get_admin_documents(headers, status_filter=None, source_filter=None, offset=None, limit=None, is_active=None, updated_since=None):
     try:
-        session = get_requests_session()
         params = {}
+        if updated_since:
+            params['updated_since'] = updated_since
         if status_filter:
             params['status_filter'] = status_filter
         if source_filter:
             params['source_filter'] = source_filter
+        if is_active is not None:
+            params['is_active'] = str(is_active).lower()
+        if offset is not None:
+            params['offset'] = offset
+        if limit is not None:
+            params['limit'] = limit
        
-        response = session.get(f"{API_BASE_URL}/admin/documents", headers=headers, params=params, timeout=60)
+        response = api_request("GET", "/admin/documents", headers=headers, params=params)
+        if response.status_code == 200:
+            return True, response.json()
+        else:
+            return False, f"Status: {response.status_code}"
+    except Exception as e:
+        return False, str(e)
+
+def iter_admin_documents(headers, filters=(None, None, None), updated_since=None, batch_size=DOC_SYNC_BATCH):
+    # Yields /admin/documents in batches of batch_size, so callers never hold
+    # more than one batch. Raises RuntimeError if a batch cannot be fetched or
+    # the backend is still returning full batches after DOC_SYNC_MAX_BATCHES.
+    status_filter, source_filter, is_active = filters
+    offset, previous_ids = 0, None
+    for _ in range(DOC_SYNC_MAX_BATCHES):
+        success, data = get_admin_documents(
+            headers, status_filter, source_filter, offset=offset, limit=batch_size,
+            is_active=is_active, updated_since=updated_since
+        )
+        if not success:
+            raise RuntimeError(f"Failed to fetch documents: {data}")
+        batch = data.get("documents", [])
+        batch_ids = [doc.get("id") for doc in batch]
+        # A backend that ignores offset hands back the same rows again
+        if batch and batch_ids == previous_ids:
+            return
+        if batch:
+            yield batch
+        # A short batch is the last one; a backend that ignores limit hands back
+        # everything at once; one that echoes a different offset is not paging
+        if (
+            len(batch) != batch_size
+            or offset + len(batch) >= data.get("total_count", offset + len(batch) + 1)
+            or data.get("offset", offset) != offset
+        ):
+            return
+        offset += len(batch)
+        previous_ids = batch_ids
+    raise RuntimeError(f"Stopped after {DOC_SYNC_MAX_BATCHES} batches of documents")
+
+def parse_timestamp(value):
+    # Aware datetime for an ISO timestamp (naive ones are taken as UTC), else None
+    if not isinstance(value, str):
+        return None
+    try:
+        parsed = datetime.fromisoformat(value.replace('Z', '+00:00'))
+    except ValueError:
+        return None
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
+
+def normalize_documents(documents):
+    # Parse last_updated_at once, as documents enter a cache, so rendering
+    # does no parsing: each record gains "_updated_at" (aware datetime or None)
+    # and "_updated_display" ("MM/DD", or the first ten characters of an
+    # unparseable value). Repeated raw values in a batch are parsed once.
+    # Updates the records in place and returns the list.
+    parsed = {}
+    for doc in documents:
+        raw = doc.get("last_updated_at")
+        key = raw if isinstance(raw, str) or raw is None else str(raw)
+        if key not in parsed:
+            updated_at = parse_timestamp(key)
+            if updated_at is not None:
+                display = updated_at.strftime('%m/%d')
+            else:
+                display = "N/A" if key in (None, "N/A") else key[:10]
+            parsed[key] = (updated_at, display)
+        doc["_updated_at"], doc["_updated_display"] = parsed[key]
+    return documents
+
+class DocumentIndex:
+    # Read-only columnar snapshot of the catalogue. Columns are lists aligned
+    # by row position; status, source and active flag resolve through
+    # per-value position sets and every sort order is computed once, so a
+    # query is a set intersection plus one pass over a presorted order.
+    def __init__(self, documents):
+        self.documents = documents
+        self.titles = [str(doc.get("title") or "").lower() for doc in documents]
+        self.ids = [str(doc.get("id")).lower() for doc in documents]
+        statuses = [str(doc.get("indexing_status") or "") for doc in documents]
+        updated = [doc["_updated_at"].timestamp() if doc.get("_updated_at") else float("-inf") for doc in documents]
+
+        self.by_status, self.by_source = {}, {}
+        self.by_active = {True: set(), False: set()}
+        for pos, doc in enumerate(documents):
+            self.by_status.setdefault(statuses[pos], set()).add(pos)
+            self.by_source.setdefault(str(doc.get("source", "")).lower(), set()).add(pos)
+            self.by_active[bool(doc.get("is_active", True))].add(pos)
+
+        positions = range(len(documents))
+        self.orders = {
+            "updated": sorted(positions, key=updated.__getitem__),
+            "title": sorted(positions, key=self.titles.__getitem__),
+            "status": sorted(positions, key=lambda pos: (statuses[pos], self.titles[pos])),
+        }
+
+    def match(self, filters, search=None):
+        # Positions passing the filters and search, or None when nothing filters
+        status_filter, source_filter, is_active = filters
+        candidates = []
+        if status_filter is not None:
+            candidates.append(self.by_status.get(status_filter, set()))
+        if source_filter:
+            # Few distinct sources, so substring-matching the keys is cheap
+            source_filter = source_filter.lower()
+            candidates.append(set().union(*(
+                rows for source, rows in self.by_source.items() if source_filter in source
+            )))
+        if is_active is not None:
+            candidates.append(self.by_active[is_active])
+        matched = set.intersection(*sorted(candidates, key=len)) if candidates else None
+        if search:
+            search = search.lower()
+            pool = matched if matched is not None else range(len(self.documents))
+            matched = {pos for pos in pool if search in self.titles[pos] or search in self.ids[pos]}
+        return matched
+
+    def query(self, filters, search=None, sort=None, descending=False):
+        matched = self.match(filters, search)
+        if sort is None:
+            order = matched if matched is not None else range(len(self.documents))
+            order = sorted(order)
+        else:
+            order = self.orders[sort][::-1] if descending else self.orders[sort]
+            if matched is not None:
+                order = [pos for pos in order if pos in matched]
+        return [self.documents[pos] for pos in order]
+
+class DocumentCatalog:
+    # Process-wide copy of /admin/documents keyed by id. The first sync pages
+    # through the whole catalogue; later ones ask only for documents updated
+    # since the newest last_updated_at already held (the watermark) and merge
+    # them in. A full sync every DOC_FULL_SYNC_INTERVAL drops documents deleted
+    # elsewhere. Held documents are shared between sessions - treat as read-only.
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._flight = SingleFlight()
+        self._documents = {}
+        self.watermark = None
+        self.last_full_sync = None
+        self.last_sync_at = None
+        self.full_syncs = 0
+        self.delta_syncs = 0
+        self.rows_merged = 0
+        self._version = 0
+        self._index = (None, None)
+
+    def __len__(self):
+        return len(self._documents)
+
+    def sync(self, headers, full=False):
+        # Concurrent callers share one backend pass
+        return self._flight.do("sync", lambda: self._sync(headers, full))
+
+    def _fetch(self, headers, updated_since):
+        try:
+            return True, [doc for batch in iter_admin_documents(headers, updated_since=updated_since) for doc in batch]
+        except RuntimeError as e:
+            return False, str(e)
+
+    def _sync(self, headers, full):
+        full = (
+            full or self.watermark is None
+            or time.monotonic() - self.last_full_sync > DOC_FULL_SYNC_INTERVAL
+        )
+        success, documents = self._fetch(headers, None if full else self.watermark)
+        if not success:
+            return False, documents
+        normalize_documents(documents)
+
+        watermark = None if full else self.watermark
+        newest = parse_timestamp(watermark)
+        for doc in documents:
+            updated = doc["_updated_at"]
+            if updated and (newest is None or updated > newest):
+                newest, watermark = updated, doc["last_updated_at"]
+
+        with self._lock:
+            if full:
+                self._documents = {}
+            for doc in documents:
+                if doc.get("is_deleted"):
+                    self._documents.pop(doc.get("id"), None)
+                else:
+                    self._documents[doc.get("id")] = doc
+            self.watermark = watermark
+            self._version += 1
+            self.last_sync_at = datetime.now()
+            self.rows_merged += len(documents)
+            if full:
+                self.full_syncs += 1
+                self.last_full_sync = time.monotonic()
+            else:
+                self.delta_syncs += 1
+        return True, {"mode": "full" if full else "delta", "changed": len(documents)}
+
+    def apply_changes(self, updated=None, deleted_ids=()):
+        # Local edits made through this app, ahead of the next sync.
+        # updated maps id -> changed fields.
+        with self._lock:
+            for doc_id, fields in (updated or {}).items():
+                if doc_id in self._documents:
+                    self._documents[doc_id] = {**self._documents[doc_id], **fields}
+            for doc_id in deleted_ids:
+                self._documents.pop(doc_id, None)
+            self._version += 1
+
+    def index(self):
+        # DocumentIndex of the current contents, rebuilt only after a change
+        version, index = self._index
+        if version == self._version:
+            return index
+        with self._lock:
+            version, documents = self._version, list(self._documents.values())
+        index = DocumentIndex(documents)
+        self._index = (version, index)
+        return index
+
+    def query(self, filters, search=None, sort=None, descending=False):
+        return self.index().query(filters, search, sort, descending)
+
+    def stats(self):
+        return {
+            "documents": len(self._documents),
+            "watermark": self.watermark,
+            "last_sync_at": self.last_sync_at,
+            "full_syncs": self.full_syncs,
+            "delta_syncs": self.delta_syncs,
+            "rows_merged": self.rows_merged,
+        }
+
+@st.cache_resource(show_spinner=False)
+def get_document_catalog():
+    return DocumentCatalog()
+
+def get_catalog_page(headers, filters, page, page_size, search=None, sort_option=None):
+    # Same shape as fetch_document_page, served from the synced catalogue,
+    # plus the summary counters for the filtered set
+    catalog = get_document_catalog()
+    if catalog.watermark is None and not len(catalog):
+        success, result = catalog.sync(headers)
+        if not success:
+            return False, result
+    sort, descending = DOC_SORT_OPTIONS.get(sort_option, (None, False))
+    matches = catalog.query(filters, search, sort, descending)
+    offset = (page - 1) * page_size
+    return True, {
+        "documents": matches[offset:offset + page_size],
+        "total_count": len(matches),
+        "summary": {
+            "total": len(matches),
+            "active": sum(1 for doc in matches if doc.get("is_active", True)),
+            "processed": sum(1 for doc in matches if doc.get("indexing_status") == "processed"),
+        },
+    }
+
+def fetch_document_page(headers, filters, page, page_size):
+    # One page of /admin/documents as {"documents": [...], "total_count": n}.
+    # A backend that ignores offset/limit returns the whole catalogue, in
+    # which case the page is cut out locally. One that honours limit but
+    # echoes a different offset is sliced locally if the reply still covers
+    # the page, otherwise reported rather than shown as the wrong page.
+    status_filter, source_filter, is_active = filters
+    offset = (page - 1) * page_size
+    success, data = get_admin_documents(
+        headers, status_filter, source_filter, offset=offset, limit=page_size, is_active=is_active
+    )
+    if not success:
+        return success, data
+    documents = data.get("documents", [])
+    total_count = data.get("total_count", len(documents))
+    if len(documents) > page_size:
+        total_count = len(documents)
+        documents = documents[offset:offset + page_size]
+    else:
+        returned_offset = data.get("offset", offset)
+        if returned_offset != offset:
+            start = offset - returned_offset
+            end = min(offset + page_size, total_count) - returned_offset
+            if start < 0 or end > len(documents):
+                return False, f"Backend ignored offset {offset} (returned offset {returned_offset})"
+            documents = documents[start:end]
+    return True, {"documents": normalize_documents(documents), "total_count": total_count}
+
+def get_document_page(headers, filters, page, page_size):
+    # Per-session LRU of recently viewed pages in st.session_state["admin_docs"];
+    # resetting that slot to None (Refresh) drops every cached page.
+    # A background prefetch of the requested page is awaited rather than repeated.
+    pages = st.session_state.get("admin_docs")
+    if pages is None:
+        pages = OrderedDict()
+        st.session_state["admin_docs"] = pages
+        st.session_state["admin_doc_prefetch"] = None
+        st.session_state["admin_doc_summary"] = None
+        st.session_state["admin_doc_reconcile"] = None
+    page_key = (filters, page, page_size)
+    apply_document_reconcile(page_key)
+    cached = pages.get(page_key)
+    if cached is not None and not cached["documents"] and cached["total_count"] > 0:
+        # A local patch emptied this page; wait for its reconcile (or refetch)
+        # rather than report that no documents match
+        reconcile = st.session_state.get("admin_doc_reconcile")
+        if reconcile is not None and reconcile[0] == page_key:
+            wait([reconcile[1]], timeout=API_TIMEOUT)
+            apply_document_reconcile(page_key)
+        if not pages[page_key]["documents"]:
+            del pages[page_key]
+    if page_key in pages:
+        pages.move_to_end(page_key)
+        return True, pages[page_key]
+
+    prefetch = st.session_state.get("admin_doc_prefetch")
+    if prefetch is not None and prefetch[0] == page_key:
+        st.session_state["admin_doc_prefetch"] = None
+        try:
+            success, data = prefetch[1].result(timeout=API_TIMEOUT)
+        except Exception as e:
+            success, data = False, str(e)
+    else:
+        success, data = fetch_document_page(headers, filters, page, page_size)
+
+    if success:
+        pages[page_key] = data
+        while len(pages) > DOC_PAGE_CACHE_SIZE:
+            pages.popitem(last=False)
+    return success, data
+
+def prefetch_document_page(headers, filters, page, page_size):
+    # Warm the next page on the prefetch pool while the admin reads this one
+    page_key = (filters, page, page_size)
+    if page_key in (st.session_state.get("admin_docs") or {}):
+        return
+    prefetch = st.session_state.get("admin_doc_prefetch")
+    if prefetch is not None and prefetch[0] == page_key:
+        return
+    future = get_prefetch_executor().submit(fetch_document_page, headers, filters, page, page_size)
+    st.session_state["admin_doc_prefetch"] = (page_key, future)
+
+def toggle_document_active(headers, doc_id):
+    try:
+        response = api_request("PUT", f"/admin/documents/{doc_id}/toggle-active", headers=headers, timeout=30)
+        if response.status_code == 200:
+            return True, response.json()
+        else:
+            return False, response.text
+    except Exception as e:
+        return False, str(e)
+
+def delete_document(headers, doc_id):
+    try:
+        response = api_request("DELETE", f"/admin/documents/{doc_id}", headers=headers)
+        if response.status_code == 200:
+            return True, response.json()
+        try:
+            error_detail = response.json().get("detail", response.text)
+        except:
+            error_detail = response.text
+        return False, f"HTTP {response.status_code}: {error_detail}"
+    except Exception as e:
+        return False, str(e)
+
+def bulk_update_documents(headers, action, docs):
+    # action is "activate", "deactivate" or "delete". Tries the backend's bulk
+    # endpoint first; without one, falls back to per-document calls with at
+    # most BULK_CONCURRENCY in flight. Returns one report row per document.
+    def report(doc, outcome, detail=""):
+        return {
+            "id": doc.get("id"),
+            "title": doc.get("title", "Untitled"),
+            "action": action,
+            "outcome": outcome,
+            "detail": str(detail)[:200],
+        }
+
+    try:
+        response = api_request(
+            "POST",
+            "/admin/documents/bulk",
+            json={"action": action, "ids": [doc["id"] for doc in docs]},
+            headers=headers
+        )
+        if response.status_code == 200:
+            results_by_id = {str(item.get("id")): item for item in response.json().get("results", [])}
+            rows = []
+            for doc in docs:
+                item = results_by_id.get(str(doc["id"]))
+                if item is None:
+                    rows.append(report(doc, "unknown", "No result returned"))
+                else:
+                    rows.append(report(doc, "ok" if item.get("success") else "failed", item.get("detail", "")))
+            return rows
+        if response.status_code not in (404, 405):
+            return [report(doc, "failed", f"Bulk request failed: HTTP {response.status_code}") for doc in docs]
+    except requests.exceptions.RequestException as e:
+        return [report(doc, "failed", str(e)) for doc in docs]
+
+    def apply(doc):
+        if action == "delete":
+            success, result = delete_document(headers, doc["id"])
+        else:
+            # toggle-active flips the flag, so only touch documents not already in the target state
+            want_active = action == "activate"
+            if bool(doc.get("is_active", True)) == want_active:
+                return report(doc, "skipped", f"Already {'active' if want_active else 'inactive'}")
+            success, result = toggle_document_active(headers, doc["id"])
+        return report(doc, "ok" if success else "failed", "" if success else result)
+
+    with ThreadPoolExecutor(max_workers=BULK_CONCURRENCY, thread_name_prefix="bulk-docs") as executor:
+        return list(executor.map(apply, docs))
+
+@track_time
+def submit_document(headers, doc_id, resource_name, page_url):
+    # POST one document for indexing; safe to call from worker threads
+    try:
+        response = api_request(
+            "POST",
+            "/admin/documents/add",
+            json={"doc_id": doc_id, "resource_name": resource_name, "page_url": page_url},
+            headers=headers
+        )
+        if response.status_code == 200:
+            return True, response.json()
+        error_detail = response.text
+        try:
+            error_detail = response.json().get("detail", error_detail)
+        except ValueError:
+            pass
+        return False, error_detail
+    except Exception as e:
+        return False, str(e)
+
+def parse_document_upload(file_name, raw_bytes):
+    # CSV with a header row, JSON Lines or a JSON array of doc_id, resource_name, page_url.
+    # Returns (rows, errors); rows only holds entries that passed validation.
+    try:
+        text = raw_bytes.decode("utf-8-sig")
+    except UnicodeDecodeError as e:
+        return [], [{"line": 0, "doc_id": "", "error": f"File is not UTF-8 encoded ({e.reason} at byte {e.start}); re-save it as UTF-8"}]
+    if file_name.lower().endswith(".csv"):
+        records = [(i + 2, record) for i, record in enumerate(csv.DictReader(io.StringIO(text)))]
+    elif text.lstrip().startswith("["):
+        # A plain JSON array of objects is accepted as well
+        try:
+            records = [(i + 1, record) for i, record in enumerate(json.loads(text))]
+        except ValueError as e:
+            records = [(1, e)]
+    else:
+        records = []
+        for i, line in enumerate(text.splitlines(), start=1):
+            if not line.strip():
+                continue
+            try:
+                records.append((i, json.loads(line)))
+            except ValueError as e:
+                records.append((i, e))
+
+    resource_lookup = {name.lower(): name for name in RESOURCE_NAMES}
+    rows, errors, seen_ids = [], [], set()
+    for line_no, record in records:
+        if len(rows) >= INGEST_MAX_ROWS:
+            errors.append({"line": line_no, "doc_id": "", "error": f"More than {INGEST_MAX_ROWS} rows; the rest were ignored"})
+            break
+        if not isinstance(record, dict):
+            errors.append({"line": line_no, "doc_id": "", "error": f"Invalid JSON: {record}"})
+            continue
+        doc_id = str(record.get("doc_id") or "").strip()
+        resource_name = str(record.get("resource_name") or "").strip()
+        page_url = str(record.get("page_url") or "").strip()
+        if not (doc_id and resource_name and page_url):
+            error = "doc_id, resource_name and page_url are required"
+        elif doc_id in seen_ids:
+            error = "Duplicate doc_id in file"
+        elif resource_name.lower() not in resource_lookup:
+            error = f"Unknown resource_name '{resource_name}'"
+        elif urlsplit(page_url).scheme not in ("http", "https") or not urlsplit(page_url).netloc:
+            error = "page_url must be an http(s) link"
+        else:
+            error = None
+        if error:
+            errors.append({"line": line_no, "doc_id": doc_id, "error": error})
+            continue
+        seen_ids.add(doc_id)
+        rows.append({"doc_id": doc_id, "resource_name": resource_lookup[resource_name.lower()], "page_url": page_url})
+    return rows, errors
+
+def ingest_documents(headers, rows, on_progress=None):
+    # Submit rows with at most INGEST_CONCURRENCY in flight over the pooled
+    # session. on_progress(done, total) runs on the calling thread, so it may
+    # update Streamlit elements. Returns result rows in input order.
+    def submit(row):
+        start_time = time.perf_counter()
+        success, result = submit_document(headers, row["doc_id"], row["resource_name"], row["page_url"])
+        return {
+            **row,
+            "outcome": "ok" if success else "failed",
+            "detail": "" if success else str(result)[:200],
+            "seconds": round(time.perf_counter() - start_time, 3),
+        }
+
+    results = [None] * len(rows)
+    with ThreadPoolExecutor(max_workers=INGEST_CONCURRENCY, thread_name_prefix="ingest-docs") as executor:
+        futures = {executor.submit(submit, row): i for i, row in enumerate(rows)}
+        for done, future in enumerate(as_completed(futures), start=1):
+            results[futures[future]] = future.result()
+            if on_progress:
+                on_progress(done, len(rows))
+    return results
+
+def results_to_csv(rows, fieldnames):
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=fieldnames, extrasaction="ignore")
+    writer.writeheader()
+    writer.writerows(rows)
+    return buffer.getvalue()
+
+def export_value(value):
+    # Flat string form of a field; lists and dicts become JSON
+    if value is None:
+        return None
+    if isinstance(value, (list, dict)):
+        return json.dumps(value, default=str)
+    return str(value)
+
+def write_export(pages, columns, export_format, path):
+    # Stream an iterable of row pages into path as gzip CSV or Parquet, one
+    # page at a time, so memory stays at one page regardless of row count.
+    # Every column is written as a string to keep the schema stable across
+    # pages. Returns the number of rows written.
+    rows_written = 0
+    if export_format == "Parquet":
+        schema = pa.schema([(column, pa.string()) for column in columns])
+        with pq.ParquetWriter(path, schema, compression="zstd") as writer:
+            for page in pages:
+                records = [{column: export_value(row.get(column)) for column in columns} for row in page]
+                writer.write_table(pa.Table.from_pylist(records, schema=schema))
+                rows_written += len(records)
+        return rows_written
+    with gzip.open(path, "wt", newline="", encoding="utf-8") as handle:
+        writer = csv.DictWriter(handle, fieldnames=columns)
+        writer.writeheader()
+        for page in pages:
+            writer.writerows({column: export_value(row.get(column)) or "" for column in columns} for row in page)
+            rows_written += len(page)
+    return rows_written
+
+@track_time
+def get_admin_documents_summary(headers, status_filter=None, source_filter=None, is_active=None):
+    # Aggregate counts ({"total", "active", "processed"}) computed by the backend
+    try:
+        params = {}
+        if status_filter:
+            params['status_filter'] = status_filter
+        if source_filter:
+            params['source_filter'] = source_filter
+        if is_active is not None:
+            params['is_active'] = str(is_active).lower()
+
+        response = api_request("GET", "/admin/documents/summary", headers=headers, params=params)
         if response.status_code == 200:
             return True, response.json()
         else:
             return False, f"Status: {response.status_code}"
     except Exception as e:
         return False, str(e)
+
+def get_document_summary(headers, filters):
+    # Summary for the current filters, kept until the page cache is reset
+    cached = st.session_state.get("admin_doc_summary")
+    if cached is not None and cached[0] == filters:
+        return cached[1]
+    success, summary = get_admin_documents_summary(headers, *filters)
+    summary = summary if success else None
+    st.session_state["admin_doc_summary"] = (filters, summary)
+    return summary
+
+def apply_document_changes(toggled=None, deleted_ids=(), updated=None):
+    # Patch the cached pages in place after a successful toggle/delete or a
+    # watched status change instead of throwing the whole cache away.
+    # toggled maps id -> new is_active; updated maps id -> changed fields.
+    updated = {doc_id: dict(fields) for doc_id, fields in (updated or {}).items()}
+    for doc_id, is_active in (toggled or {}).items():
+        updated.setdefault(doc_id, {})["is_active"] = is_active
+    deleted_ids = set(deleted_ids)
+    pages = st.session_state.get("admin_docs") or {}
+    previous_docs, removed_docs = {}, {}
+    # Per filter set: ids that left the result set, and the first page they left from
+    left_ids, first_shifted_page = {}, {}
+    for (filters, page, page_size), data in pages.items():
+        status_param, _, active_param = filters
+        kept = []
+        for doc in data["documents"]:
+            doc_id = doc.get("id")
+            leaves = doc_id in deleted_ids
+            if leaves:
+                removed_docs[doc_id] = doc
+            elif doc_id in updated:
+                previous_docs.setdefault(doc_id, doc)
+                doc = {**doc, **updated[doc_id]}
+                # Under a status or active filter a changed doc may leave the result set
+                leaves = (
+                    (active_param is not None and doc.get("is_active", True) != active_param)
+                    or (status_param is not None and doc.get("indexing_status") != status_param)
+                )
+            if leaves:
+                left_ids.setdefault(filters, set()).add(doc_id)
+                shift_key = (filters, page_size)
+                first_shifted_page[shift_key] = min(page, first_shifted_page.get(shift_key, page))
+                continue
+            kept.append(doc)
+        data["documents"] = kept
+
+    # Every cached page of a filter set shares its total
+    for (filters, page, page_size), data in pages.items():
+        data["total_count"] = max(0, data["total_count"] - len(left_ids.get(filters, ())))
+
+    # A row leaving the result set shifts every later page up by one row;
+    # drop those so they refetch
+    for page_key in list(pages.keys()):
+        filters, page, page_size = page_key
+        shifted_from = first_shifted_page.get((filters, page_size))
+        if shifted_from is not None and page > shifted_from:
+            del pages[page_key]
+    if deleted_ids or updated:
+        # An in-flight next-page prefetch was issued before the change
+        st.session_state["admin_doc_prefetch"] = None
+
+    active_delta, processed_delta = 0, 0
+    for doc_id, fields in updated.items():
+        previous = previous_docs.get(doc_id, {})
+        if "is_active" in fields:
+            active_delta += int(bool(fields["is_active"])) - int(bool(previous.get("is_active", not fields["is_active"])))
+        if "indexing_status" in fields and doc_id in previous_docs:
+            processed_delta += (fields["indexing_status"] == "processed") - (previous.get("indexing_status") == "processed")
+    for doc in removed_docs.values():
+        active_delta -= 1 if doc.get("is_active", True) else 0
+        processed_delta -= 1 if doc.get("indexing_status") == "processed" else 0
+    cached_summary = st.session_state.get("admin_doc_summary")
+    if cached_summary is not None and cached_summary[1]:
+        summary = dict(cached_summary[1])
+        for field, delta in (("active", active_delta), ("processed", processed_delta), ("total", -len(removed_docs))):
+            if isinstance(summary.get(field), int):
+                summary[field] = max(0, summary[field] + delta)
+        st.session_state["admin_doc_summary"] = (cached_summary[0], summary)
+
+    get_document_catalog().apply_changes(updated, deleted_ids)
+
+    # Row identity changed, so start the grid's selection state afresh
+    st.session_state["doc_grid_version"] = st.session_state.get("doc_grid_version", 0) + 1
+
+def fetch_document_reconcile(headers, filters, page, page_size):
+    page_result = fetch_document_page(headers, filters, page, page_size)
+    summary_result = get_admin_documents_summary(headers, *filters)
+    return page_result, summary_result
+
+def schedule_document_reconcile(headers, filters, page, page_size):
+    # Re-read the visible page and counters in the background after an
+    # optimistic patch; the result is swapped in on a later rerun
+    if st.session_state.get("doc_source_mode") == "Local catalogue":
+        get_prefetch_executor().submit(get_document_catalog().sync, headers)
+        return
+    future = get_prefetch_executor().submit(fetch_document_reconcile, headers, filters, page, page_size)
+    st.session_state["admin_doc_reconcile"] = ((filters, page, page_size), future)
+
+def apply_document_reconcile(page_key):
+    reconcile = st.session_state.get("admin_doc_reconcile")
+    if reconcile is None or reconcile[0] != page_key or not reconcile[1].done():
+        return
+    st.session_state["admin_doc_reconcile"] = None
+    try:
+        (page_ok, page_data), (summary_ok, summary) = reconcile[1].result()
+    except Exception:
+        return
+    if page_ok:
+        st.session_state["admin_docs"][page_key] = page_data
+    if summary_ok:
+        st.session_state["admin_doc_summary"] = (page_key[0], summary)
+
+@track_time
+def get_documents_status(headers, doc_ids, updated_since=None):
+    # {id: doc} for the requested ids, with at least indexing_status. Uses the
+    # status endpoint when the backend has one; otherwise asks for documents
+    # updated since updated_since (required then) and keeps the requested ones.
+    try:
+        response = api_request(
+            "GET", "/admin/documents/status", headers=headers,
+            params={"ids": ",".join(str(doc_id) for doc_id in doc_ids)}
+        )
+        if response.status_code == 200:
+            return True, {doc.get("id"): doc for doc in response.json().get("documents", [])}
+        if response.status_code not in (404, 405):
+            return False, f"Status: {response.status_code}"
+    except Exception as e:
+        return False, str(e)
+    if not updated_since:
+        # Without a timestamp the fallback would download the whole catalogue on every poll
+        return False, "Backend has no status endpoint and the watched documents have no last_updated_at"
+    success, data = get_admin_documents(headers, updated_since=updated_since)
+    if not success:
+        return False, data
+    wanted = set(doc_ids)
+    return True, {doc.get("id"): doc for doc in data.get("documents", []) if doc.get("id") in wanted}
+
+def start_document_watch(docs):
+    # Add any processing/pending documents to the session's watch list
+    watch = st.session_state.get("doc_watch")
+    if watch is None:
+        watch = {
+            "ids": {}, "since": None, "finished": [], "polls": 0, "error": None,
+            "interval": DOC_WATCH_MIN_INTERVAL, "next_poll_at": time.monotonic(),
+        }
+        st.session_state["doc_watch"] = watch
+    new_docs = [
+        doc for doc in docs
+        if doc.get("indexing_status") in DOC_WATCH_STATUSES and doc.get("id") not in watch["ids"]
+    ]
+    if not new_docs:
+        return watch
+    for doc in new_docs:
+        watch["ids"][doc.get("id")] = doc.get("indexing_status")
+        updated_at = doc.get("_updated_at")
+        if updated_at and (watch["since"] is None or updated_at < parse_timestamp(watch["since"])):
+            watch["since"] = doc["last_updated_at"]
+    # New work to follow: poll soon again
+    watch["interval"] = DOC_WATCH_MIN_INTERVAL
+    watch["next_poll_at"] = min(watch["next_poll_at"], time.monotonic() + DOC_WATCH_MIN_INTERVAL)
+    return watch
+
+def poll_document_watch(headers):
+    # One watcher step, skipped until the backoff interval has passed. The
+    # interval doubles on every poll without changes (up to
+    # DOC_WATCH_MAX_INTERVAL) and drops back to the minimum when a status moves.
+    # Returns how many watched documents changed.
+    watch = st.session_state.get("doc_watch")
+    now = time.monotonic()
+    if not watch or not watch["ids"] or now < watch["next_poll_at"]:
+        return 0
+    success, statuses = get_documents_status(headers, list(watch["ids"]), watch["since"])
+    watch["polls"] += 1
+    watch["error"] = None if success else statuses
+    changed = {}
+    for doc_id, doc in (statuses.items() if success else ()):
+        if doc_id in watch["ids"] and doc.get("indexing_status") != watch["ids"][doc_id]:
+            changed[doc_id] = {
+                field: doc[field] for field in ("indexing_status", "error_message", "last_updated_at") if field in doc
+            }
+    if changed:
+        normalize_documents([fields for fields in changed.values() if "last_updated_at" in fields])
+        apply_document_changes(updated=changed)
+        for doc_id, fields in changed.items():
+            status = fields.get("indexing_status")
+            if status in DOC_WATCH_STATUSES:
+                watch["ids"][doc_id] = status
+            else:
+                del watch["ids"][doc_id]
+                watch["finished"].append({"id": doc_id, "status": status, "at": datetime.now().strftime("%H:%M:%S")})
+        watch["interval"] = DOC_WATCH_MIN_INTERVAL
+    else:
+        watch["interval"] = min(watch["interval"] * 2, DOC_WATCH_MAX_INTERVAL)
+    watch["next_poll_at"] = now + watch["interval"]
+    return len(changed)
  
 @track_time
 def get_admin_users(headers):
     try:
-        session = get_requests_session()
-        response = session.get(f"{API_BASE_URL}/admin/users", headers=headers, timeout=60)
+        response = api_request("GET", "/admin/users", headers=headers)
         if response.status_code == 200:
             return True, response.json()
         else:
@@ -140,8 +1540,7 @@ def get_admin_users(headers):
 @track_time
 def get_admin_analytics(headers, days=30):
     try:
-        session = get_requests_session()
-        response = session.get(f"{API_BASE_URL}/admin/analytics", headers=headers, params={"days": days}, timeout=60)
+        response = api_request("GET", "/admin/analytics", headers=headers, params={"days": days})
         if response.status_code == 200:
             return True, response.json()
         else:
@@ -150,36 +1549,464 @@ def get_admin_analytics(headers, days=30):
         return False, str(e)
  
 @track_time
-def get_admin_safety_logs(headers, event_type=None, content_blocked=None):
+def get_admin_safety_logs(headers, event_type=None, content_blocked=None, since=None, limit=None, cursor=None, offset=None):
     try:
-        session = get_requests_session()
         params = {}
         if event_type:
             params['event_type'] = event_type
         if content_blocked is not None:
             params['content_blocked'] = content_blocked
+        if since:
+            params['since'] = since
+        if limit is not None:
+            params['limit'] = limit
+        if cursor:
+            params['cursor'] = cursor
+        if offset:
+            params['offset'] = offset
        
-        response = session.get(f"{API_BASE_URL}/admin/safety-logs", headers=headers, params=params, timeout=60)
+        response = api_request("GET", "/admin/safety-logs", headers=headers, params=params)
         if response.status_code == 200:
             return True, response.json()
         else:
             return False, f"Status: {response.status_code}"
     except Exception as e:
         return False, str(e)
- 
+
+def fetch_safety_log_page(headers, filters, since, cursor, page_size):
+    # One page of safety logs as {"safety_logs", "total_count", "next_cursor"}.
+    # The window, page size and cursor are sent to the backend. Without
+    # "next_cursor" in the reply the backend has no cursor paging:
+    # - if it sent every match (no more rows than its total_count says), that
+    #   result is windowed and returned whole under "all_logs" so the caller
+    #   can page through it locally;
+    # - otherwise it honoured limit, so later pages are asked for by offset,
+    #   carried in cursors of the form "offset:<n>". total_count is the
+    #   backend's own (None when it sends none).
+    categories, severity = filters
+    offset = None
+    if cursor and cursor.startswith("offset:"):
+        offset, cursor = int(cursor[len("offset:"):]), None
+    success, data = get_admin_safety_logs(
+        headers, categories, severity, since=since, limit=page_size, cursor=cursor, offset=offset
+    )
+    if not success:
+        return False, data
+    logs = data.get("safety_logs", [])
+    if "next_cursor" in data:
+        return True, {
+            "safety_logs": logs,
+            "total_count": data.get("total_count", 0),
+            "next_cursor": data.get("next_cursor"),
+        }
+    total_count = data.get("total_count")
+    complete = len(logs) >= total_count if total_count is not None else len(logs) < page_size
+    if offset is None and complete:
+        if since:
+            cutoff = parse_timestamp(since)
+            logs = [log for log in logs if (parse_timestamp(log.get("created_date")) or cutoff) >= cutoff]
+        return True, {"all_logs": logs}
+    start = offset or 0
+    if data.get("offset", start) != start:
+        return False, f"Backend ignored offset {start} while paging safety logs"
+    next_offset = start + len(logs)
+    has_more = next_offset < total_count if total_count is not None else len(logs) >= page_size
+    return True, {
+        "safety_logs": logs,
+        "total_count": total_count,
+        "next_cursor": f"offset:{next_offset}" if logs and has_more else None,
+    }
+
+def get_safety_log_page(headers, categories, severity, time_range, cursor=None):
+    # Per-session cache in st.session_state["safety_logs"]: one entry per
+    # (categories, severity, time range) holding the window start and every
+    # page fetched for it. An entry lives SAFETY_LOG_TTL seconds; resetting the
+    # slot to None (Refresh) drops them all. Returns (success, page, fetched_at).
+    cache = st.session_state.get("safety_logs")
+    if cache is None:
+        cache = {}
+        st.session_state["safety_logs"] = cache
+    key = (categories, severity, time_range)
+    entry = cache.get(key)
+    if entry is None or time.monotonic() - entry["created"] >= SAFETY_LOG_TTL:
+        # Fix the window start once so later pages line up with the first
+        entry = {
+            "created": time.monotonic(),
+            "fetched_at": datetime.now(),
+            "since": safety_window_start(time_range),
+            "pages": {},
+            "all_logs": None,
+        }
+        cache[key] = entry
+
+    if entry["all_logs"] is None and cursor not in entry["pages"]:
+        success, data = fetch_safety_log_page(headers, (categories, severity), entry["since"], cursor, SAFETY_PAGE_SIZE)
+        if not success:
+            return False, data, None
+        if "all_logs" in data:
+            entry["all_logs"] = data["all_logs"]
+        else:
+            entry["pages"][cursor] = data
+
+    if entry["all_logs"] is not None:
+        # Backend without cursor paging: cursors are offsets into the windowed result
+        offset = int(cursor or 0)
+        logs = entry["all_logs"]
+        next_offset = offset + SAFETY_PAGE_SIZE
+        page = {
+            "safety_logs": logs[offset:next_offset],
+            "total_count": len(logs),
+            "next_cursor": str(next_offset) if next_offset < len(logs) else None,
+        }
+        return True, page, entry["fetched_at"]
+    return True, entry["pages"][cursor], entry["fetched_at"]
+
+def safety_window_start(time_range):
+    window = SAFETY_TIME_WINDOWS.get(time_range)
+    return (datetime.now(timezone.utc) - window).isoformat() if window else None
+
+def iter_safety_logs(headers, categories, severity, since, page_size=SAFETY_STREAM_PAGE_SIZE):
+    # Yields lists of safety logs page by page, following the backend cursor,
+    # so callers never hold more than one page. Raises RuntimeError if a page
+    # cannot be fetched or the pages stop short of the backend's total_count,
+    # so an export or rollup is never silently incomplete.
+    cursor, previous_ids, rows_seen, total_count = None, None, 0, None
+    while True:
+        success, data = fetch_safety_log_page(headers, (categories, severity), since, cursor, page_size)
+        if not success:
+            raise RuntimeError(f"Failed to fetch safety logs: {data}")
+        if "all_logs" in data:
+            # Backend without cursor paging already sent everything
+            for offset in range(0, len(data["all_logs"]), page_size):
+                yield data["all_logs"][offset:offset + page_size]
+            return
+        page_ids = [log.get("id") for log in data["safety_logs"]]
+        if data["safety_logs"] and page_ids == previous_ids:
+            raise RuntimeError("Backend returned the same safety logs for consecutive pages")
+        if data["total_count"] is not None:
+            total_count = data["total_count"]
+        if data["safety_logs"]:
+            rows_seen += len(data["safety_logs"])
+            yield data["safety_logs"]
+        cursor = data.get("next_cursor")
+        if not cursor or not data["safety_logs"]:
+            if total_count is not None and rows_seen < total_count:
+                raise RuntimeError(f"Backend returned {rows_seen} of {total_count} safety logs")
+            return
+        previous_ids = page_ids
+
+@track_time
+def get_safety_log_summary(headers, categories=None, severity=None, since=None):
+    # Server-side counts as {"total", "by_category", "by_severity", "by_day"};
+    # (True, None) when the backend has no summary endpoint
+    try:
+        params = {}
+        if categories:
+            params['event_type'] = categories
+        if severity is not None:
+            params['content_blocked'] = severity
+        if since:
+            params['since'] = since
+        response = api_request("GET", "/admin/safety-logs/summary", headers=headers, params=params)
+        if response.status_code == 200:
+            return True, response.json()
+        if response.status_code in (404, 405):
+            return True, None
+        return False, f"Status: {response.status_code}"
+    except Exception as e:
+        return False, str(e)
+
+def rollup_safety_logs(pages, max_logs=SAFETY_ROLLUP_MAX_LOGS):
+    # Counts by category, severity and day over a stream of log pages, one
+    # DataFrame per page, keeping only the running totals. Stops after
+    # max_logs and reports that in "truncated".
+    by_category, by_severity, by_day = Counter(), Counter(), Counter()
+    total, truncated = 0, False
+    for page in pages:
+        frame = pd.DataFrame(page, columns=["categories", "severity", "created_date"])
+        # A log may carry a list of categories; count each one
+        by_category.update(frame["categories"].explode().dropna().astype(str).value_counts().to_dict())
+        by_severity.update(frame["severity"].dropna().astype(str).value_counts().to_dict())
+        days = pd.to_datetime(frame["created_date"], utc=True, errors="coerce").dt.strftime("%Y-%m-%d")
+        by_day.update(days.dropna().value_counts().to_dict())
+        total += len(frame)
+        if total >= max_logs:
+            truncated = True
+            break
+    return {
+        "total": total,
+        "by_category": dict(by_category),
+        "by_severity": dict(by_severity),
+        "by_day": dict(sorted(by_day.items())),
+        "truncated": truncated,
+    }
+
+def get_safety_analytics(headers, categories, severity, time_range):
+    # Summary for the safety charts, cached per session like the log pages.
+    # Prefers the backend aggregation and falls back to a local rollup.
+    # Returns (success, summary, source).
+    cache = st.session_state.get("safety_summary")
+    if cache is None:
+        cache = {}
+        st.session_state["safety_summary"] = cache
+    key = (categories, severity, time_range)
+    entry = cache.get(key)
+    if entry is not None and time.monotonic() - entry[0] < SAFETY_LOG_TTL:
+        return True, entry[1], entry[2]
+    since = safety_window_start(time_range)
+    success, summary = get_safety_log_summary(headers, categories, severity, since)
+    if not success:
+        return False, summary, None
+    source = "server"
+    if summary is None:
+        try:
+            summary = rollup_safety_logs(iter_safety_logs(headers, categories, severity, since))
+        except RuntimeError as e:
+            return False, str(e), None
+        source = "local"
+    cache[key] = (time.monotonic(), summary, source)
+    return True, summary, source
+
+@shared_cache(ttl=SHARED_CACHE_TTL)
 @track_time
 def get_top_questions(headers):
     try:
-        session = get_requests_session()
-       
- 
-        response = session.get(f"{API_BASE_URL}/faq", headers=headers, timeout=60)
+        response = api_request("GET", "/faq", headers=headers)
         if response.status_code == 200:
             return True, response.json()
         else:
             return False, f"Status: {response.status_code}"
     except Exception as e:
         return False, str(e)
+
+def parse_chat_result(result):
+    # The answer payload arrives as a JSON string; plain text becomes a bare answer
+    try:
+        result_json = json.loads(result["response"])
+    except:
+        result_json = {"answer": result["response"],
+                       "citation": [],
+                       "follow_up": []}
+    response_id = result.get("request_id") or result.get("response_id") or str(uuid.uuid4())
+    return result_json, response_id, result.get("chat_history_id")
+
+def iter_chat_stream(response):
+    # Yields frames from an SSE ("data: {...}") or newline-delimited JSON body:
+    # {"type": "token", "content": ...} while generating, then one
+    # {"type": "final", "response": ..., "request_id": ..., "chat_history_id": ...}
+    # Both formats are UTF-8; requests would otherwise guess from Content-Type
+    # (bytes for ndjson, ISO-8859-1 for an SSE body without a charset)
+    response.encoding = "utf-8"
+    for line in response.iter_lines(decode_unicode=True):
+        if not line or line.startswith(":") or line.startswith("event:"):
+            continue
+        if line.startswith("data:"):
+            line = line[len("data:"):].strip()
+        if line == "[DONE]":
+            break
+        try:
+            frame = json.loads(line)
+        except ValueError:
+            frame = {"type": "token", "content": line}
+        yield frame
+
+def is_stream_response(response):
+    content_type = response.headers.get("content-type", "")
+    return content_type.startswith(("text/event-stream", "application/x-ndjson"))
+
+def sweep_exports(max_age=EXPORT_MAX_AGE):
+    # Export files outlive the sessions that made them; drop any older than max_age
+    cutoff = time.time() - max_age
+    try:
+        entries = list(os.scandir(EXPORT_DIR))
+    except OSError:
+        return
+    for entry in entries:
+        try:
+            if entry.is_file() and entry.stat().st_mtime < cutoff:
+                os.remove(entry.path)
+        except OSError:
+            pass
+
+def render_export_panel(export_key, file_stem, columns, make_pages):
+    # Export controls for one dataset. make_pages() returns a fresh iterable
+    # of row pages; they are streamed into a temporary file, and only the
+    # compressed file is read back for the download button.
+    exports = st.session_state.setdefault("exports", {})
+    export_col1, export_col2 = st.columns([2, 1])
+    with export_col1:
+        export_format = st.selectbox("Format", list(EXPORT_FORMATS), key=f"{export_key}_export_format")
+    with export_col2:
+        st.markdown("<br>", unsafe_allow_html=True)
+        prepare_clicked = st.button("📦 Prepare export", key=f"{export_key}_export_prepare", use_container_width=True)
+    if prepare_clicked:
+        previous = exports.pop(export_key, None)
+        if previous:
+            try:
+                os.remove(previous["path"])
+            except OSError:
+                pass
+        sweep_exports()
+        os.makedirs(EXPORT_DIR, exist_ok=True)
+        suffix, mime = EXPORT_FORMATS[export_format]
+        with tempfile.NamedTemporaryFile(prefix=f"{file_stem}_", suffix=suffix, dir=EXPORT_DIR, delete=False) as handle:
+            path = handle.name
+        progress = st.empty()
+
+        def tracked(pages):
+            rows_seen = 0
+            for page in pages:
+                rows_seen += len(page)
+                progress.caption(f"Exported {rows_seen} rows...")
+                yield page
+
+        start_time = time.perf_counter()
+        try:
+            rows_written = write_export(tracked(make_pages()), columns, export_format, path)
+        except Exception as e:
+            os.remove(path)
+            progress.empty()
+            st.error(f"❌ Export failed: {e}")
+            return
+        progress.empty()
+        exports[export_key] = {
+            "path": path,
+            "file_name": f"{file_stem}_{datetime.now().strftime('%Y%m%d_%H%M%S')}{suffix}",
+            "mime": mime,
+            "rows": rows_written,
+            "seconds": time.perf_counter() - start_time,
+        }
+    export = exports.get(export_key)
+    if export and os.path.exists(export["path"]):
+        st.caption(
+            f"{export['rows']} rows · {os.path.getsize(export['path']) / 1024:.0f} KiB · "
+            f"built in {export['seconds']:.1f}s"
+        )
+        with open(export["path"], "rb") as handle:
+            st.download_button(
+                "📥 Download export",
+                data=handle,
+                file_name=export["file_name"],
+                mime=export["mime"],
+                key=f"{export_key}_export_download",
+                use_container_width=True
+            )
+
+def render_chat_extras(result_json):
+    # Citations and follow-ups shown under an assistant answer
+    if len(result_json.get("citation", [])) > 0:
+        st.markdown("---")
+        st.markdown("**Citations:**")
+        st.markdown("\n".join([f"- [Reference {i+1}]({citation})" for i, citation in enumerate(result_json.get("citation"))]))
+    if len(result_json.get("follow_up", [])) > 0:
+        st.markdown("---")
+        st.markdown("**Follow Up:**")
+        st.markdown("\n".join([f"{i+1}. {follow} " for i, follow in enumerate(result_json.get("follow_up"))]))
+
+class ChatRequest:
+    # Handle for a /chat call running on the chat worker pool. Lives in
+    # st.session_state so any rerun can poll it, show progress or cancel it.
+    def __init__(self, prompt):
+        self.prompt = prompt
+        self.request_key = uuid.uuid4().hex
+        self.started_at = time.perf_counter()
+        self.cancel_event = threading.Event()
+        self.partial_answer = ""
+        self.stream_unsupported = False
+        self.future = None
+
+    def cancel(self):
+        self.cancel_event.set()
+        if self.future is not None:
+            self.future.cancel()
+
+    @property
+    def cancelled(self):
+        return self.cancel_event.is_set()
+
+    @property
+    def elapsed(self):
+        return time.perf_counter() - self.started_at
+
+@st.cache_resource(show_spinner=False)
+def get_chat_executor():
+    return ThreadPoolExecutor(max_workers=CHAT_WORKERS, thread_name_prefix="chat-worker")
+
+def run_chat_request(chat_request, request_data, headers, use_stream):
+    # Runs on a chat worker thread, so no st.* calls in here.
+    # Returns (status, payload) with status one of ok / cancelled / warning / error.
+    if chat_request.cancelled:
+        return "cancelled", None
+    try:
+        response = None
+        if use_stream:
+            response = api_request(
+                "POST",
+                CHAT_STREAM_PATH,
+                json=request_data,
+                timeout=CHAT_TIMEOUT,
+                headers={**headers, "Accept": "text/event-stream"},
+                stream=True
+            )
+            if response.status_code in (404, 405):
+                response.close()
+                chat_request.stream_unsupported = True
+                response = None
+
+        if response is None:
+            if chat_request.cancelled:
+                return "cancelled", None
+            response = api_request(
+                "POST",
+                "/chat",
+                json=request_data,
+                timeout=CHAT_TIMEOUT,
+                headers=headers,
+                stream=True
+            )
+
+        # Leaving this block closes the response; on a cancelled stream that
+        # drops the connection so the backend can stop generating
+        with response:
+            if chat_request.cancelled:
+                return "cancelled", None
+            if response.status_code == 200:
+                if not is_stream_response(response):
+                    return "ok", response.json()
+                result = None
+                for frame in iter_chat_stream(response):
+                    if chat_request.cancelled:
+                        return "cancelled", None
+                    frame_type = frame.get("type", "token")
+                    if frame_type == "token":
+                        chat_request.partial_answer += frame.get("content", "")
+                    elif frame_type == "final":
+                        result = frame
+                    elif frame_type == "error":
+                        return "error", f"Request error: {frame.get('detail', 'Stream interrupted')}"
+                return "ok", result or {"response": chat_request.partial_answer}
+            elif response.status_code == 429:
+                return "error", "Rate limit exceeded. Please wait before sending another message."
+            elif response.status_code == 503:
+                return "warning", "ARB Chatbot Server busy. Request queued for processing."
+            else:
+                error_detail = response.text
+                try:
+                    error_json = response.json()
+                    error_detail = error_json.get("detail", error_detail)
+                except:
+                    pass
+                return "error", f"Error {response.status_code}: {error_detail}. Please refresh the page and try again."
+
+    except requests.exceptions.Timeout:
+        return "error", f"Request timed out after {CHAT_TIMEOUT} seconds. Please re-submit your query."
+    except requests.exceptions.ConnectionError:
+        return "error", "Connection error. Is the FastAPI server running on port 8000?"
+    except requests.exceptions.RequestException as e:
+        return "error", f"Request error: {str(e)}"
+    except (TypeError, ValueError) as e:
+        # Malformed stream frame or response body
+        return "error", f"Invalid response from server: {str(e)}"
  
 # Page config and Custom CSS
 st.set_page_config(
@@ -188,6 +2015,9 @@ st.set_page_config(
     layout="wide",
     initial_sidebar_state="expanded"
 )
+start_metrics_exporters()
+render_profiler = get_render_profiler()
+render_profiler.start_run()
  
 # Custom CSS
 st.markdown("""
@@ -615,6 +2445,7 @@ function scrollToTop() {
 }
 </script>
 """, unsafe_allow_html=True)
+render_profiler.checkpoint("css_injection")
 
 # Compact Header Layout
 header_col1, header_col2, header_col3 = st.columns([4, 3, 3])
@@ -669,13 +2500,22 @@ with header_col3:
             st.rerun()
     
     with control_col3:
-        # Status indicator
-        is_connected, health_data = test_api_connection()
-        status_color = "🟢" if is_connected else "🔴"
-        status_text = "Online" if is_connected else "Offline"
-        st.markdown(f"{status_color} {status_text}")
+        # Status indicator - rendered from the background health monitor's cache
+        health = get_health_monitor().status()
+        if health["last_checked_at"] is None:
+            status_color, status_text = "⚪", "Checking"
+        else:
+            status_color = "🟢" if health["is_connected"] else "🔴"
+            status_text = "Online" if health["is_connected"] else "Offline"
+        last_success = health["last_success_at"].strftime("%H:%M:%S") if health["last_success_at"] else "never"
+        last_latency = f"{health['last_latency'] * 1000:.0f} ms" if health["last_latency"] is not None else "n/a"
+        st.markdown(
+            f"{status_color} {status_text}",
+            help=f"Last check latency: {last_latency} · Last success: {last_success}"
+        )
 
 st.markdown("---")
+render_profiler.checkpoint("header")
  
 def add_document(doc_id, resource_name, page_url):
     # Retrieve token from the cookie manager
@@ -684,31 +2524,12 @@ def add_document(doc_id, resource_name, page_url):
         st.error("Session expired. Please log in again.")
         st.stop()
  
-    # Prepare the endpoint and headers
-    endpoint = f"{API_BASE_URL}/admin/documents/add"
-    payload = {
-        "doc_id": doc_id,
-        "resource_name": resource_name,
-        "page_url": page_url
-    }
     headers = {"Authorization": f"Bearer {token}"}
- 
-    # Send the POST request
-    try:
-        response = requests.post(endpoint, json=payload, headers=headers)
-        if response.status_code == 200:
-            return response.json()
-        else:
-            error_detail = response.text
-            try:
-                error_detail = response.json().get("detail", error_detail)
-            except:
-                pass
-            st.error(f"Failed to add document: {error_detail}")
-            return None
-    except requests.exceptions.RequestException as e:
-        st.error(f"Network error: {str(e)}")
-        return None
+    success, result = submit_document(headers, doc_id, resource_name, page_url)
+    if success:
+        return result
+    st.error(f"Failed to add document: {result}")
+    return None
  
  
 def get_all_cookies():
@@ -759,7 +2580,9 @@ if __name__ == "__main__":
     if 'access_token' not in st.session_state:
         if 'access_token' in  st.session_state['cookies']:
             st.session_state['access_token'] = st.session_state['cookies']['access_token']
-    if 'access_token' in st.session_state:
+    # Once a session is authenticated the token is re-checked in parallel with
+    # the page loads below, keeping this call off the critical path
+    if 'access_token' in st.session_state and not st.session_state['authenticated']:
         if validate_user(st.session_state['access_token']):
             st.session_state["authenticated"] = True
     if st.session_state['authenticated'] == False:
@@ -770,6 +2593,38 @@ if __name__ == "__main__":
         user_email = st.session_state['email_id']
         st.write(f"User Email: {user_email}")
         is_admin = check_admin_access(user_email)
+
+        # Fan out the independent page loads so first paint costs the slowest
+        # backend call instead of the sum of all of them. Anything that misses
+        # the deadline is fetched again by its own section below.
+        prefetch_headers = {"Authorization": f"Bearer {st.session_state['access_token']}"}
+        prefetch_tasks = {"token_valid": (validate_user, (st.session_state['access_token'],))}
+        if not st.session_state.get('show_admin') and not st.session_state["faqs"]:
+            prefetch_tasks["faqs"] = (get_top_questions, (prefetch_headers,))
+        if not st.session_state['feedback_stats']:
+            prefetch_tasks["feedback_stats"] = (get_feedback_stats, (prefetch_headers,))
+        if not st.session_state['feedback']:
+            prefetch_tasks["feedback"] = (get_user_feedback, (prefetch_headers,))
+        prefetched = run_parallel(prefetch_tasks)
+        for state_key in ("faqs", "feedback_stats", "feedback"):
+            result = prefetched.get(state_key)
+            if isinstance(result, tuple) and result[0]:
+                st.session_state[state_key] = result[1]
+       
+        # Validate SSO token with backend; a prefetch that raised or missed the
+        # deadline is retried here rather than taken as a pass
+        token = st.session_state["access_token"]
+        if token:
+            token_valid = prefetched.get("token_valid")
+            if token_valid is not True:
+                token_valid = validate_user(token)
+            if not token_valid:
+                st.error("SSO token validation failed. Please refresh and login again.")
+                st.session_state["access_token"] = None
+                st.session_state["authenticated"] = False
+                login()
+                st.stop()
+        render_profiler.checkpoint("auth_and_prefetch")
        
         # Admin Panel UI
         def render_admin_panel():
@@ -784,13 +2639,24 @@ if __name__ == "__main__":
            
             headers = {"Authorization": f"Bearer {token}"}
            
-            # Admin navigation tabs
-            admin_tab1, admin_tab2, admin_tab3, admin_tab4 = st.tabs([
-                "📄 Documents", "🛡️ Safety", "➕ Add Document", "📋 Manage Process Owners"
-            ])
+            # Streamlit forgets a widget's value on a run where it is not drawn;
+            # re-storing it keeps each section's filters across section switches
+            for widget_key in ADMIN_PERSISTENT_WIDGETS:
+                if widget_key in st.session_state:
+                    st.session_state[widget_key] = st.session_state[widget_key]
+           
+            # Admin navigation - st.tabs would run every tab body on each rerun,
+            # so a section router renders (and fetches for) only the selected one
+            admin_section = st.radio(
+                "Admin section",
+                ADMIN_SECTIONS,
+                horizontal=True,
+                key="admin_section",
+                label_visibility="collapsed"
+            )
            
            
-            with admin_tab1:
+            if admin_section == "📄 Documents":
                 st.markdown("""
                 <div style="background: linear-gradient(135deg, #FFA500 0%, #FF4500 100%);
                            color: white; padding: 1.5rem; border-radius: 15px; margin-bottom: 2rem;">
@@ -818,41 +2684,110 @@ if __name__ == "__main__":
                     )
                 with col4:
                     if st.button("🔄 Refresh", use_container_width=True, key="refresh_button_1"):
+                        if st.session_state.get("doc_source_mode") == "Local catalogue":
+                            # Only documents changed since the last sync are fetched
+                            with st.spinner("Syncing changed documents..."):
+                                get_document_catalog().sync(headers)
                         st.session_state["admin_docs"] = None
                         st.rerun()
                
-                # Get documents
+                # Grid view renders the page as one data editor widget; Rows keeps the per-row layout.
+                # Server pages asks the backend for every page; Local catalogue filters a
+                # synced copy of all documents that Refresh keeps current with delta syncs.
+                view_col1, view_col2, view_col3 = st.columns([2, 2, 1])
+                with view_col1:
+                    doc_view = st.radio(
+                        "View",
+                        ["Grid", "Rows"],
+                        horizontal=True,
+                        key="doc_view_mode"
+                    )
+                with view_col2:
+                    doc_source = st.radio(
+                        "Data source",
+                        ["Server pages", "Local catalogue"],
+                        horizontal=True,
+                        key="doc_source_mode"
+                    )
+                with view_col3:
+                    if doc_view == "Grid":
+                        grid_page_size = st.selectbox(
+                            "Rows per page",
+                            DOC_GRID_PAGE_SIZES,
+                            index=DOC_GRID_PAGE_SIZES.index(DOC_PAGE_SIZE) if DOC_PAGE_SIZE in DOC_GRID_PAGE_SIZES else 0,
+                            key="doc_grid_page_size"
+                        )
+               
+                # Get documents - one page at a time from the server or the local catalogue
                 status_param = None if status_filter == "All" else status_filter
                 source_param = source_filter if source_filter else None
-                if not st.session_state["admin_docs"]:
-                    status, admin_docs = get_admin_documents(headers, status_param, source_param)
-                    if status:
-                        st.session_state["admin_docs"] = admin_docs
+                active_param = None if active_filter == "All" else active_filter == "Active"
+                doc_filters = (status_param, source_param, active_param)
+                ITEMS_PER_PAGE = grid_page_size if doc_view == "Grid" else DOC_PAGE_SIZE
+                doc_search, doc_sort = None, None
+                if doc_source == "Local catalogue":
+                    # Search and sort run against the indexed catalogue, no round-trip
+                    search_col, sort_col = st.columns([3, 1])
+                    with search_col:
+                        doc_search = st.text_input(
+                            "🔎 Search titles and IDs", key="doc_search", placeholder="Type to filter"
+                        ).strip() or None
+                    with sort_col:
+                        doc_sort = st.selectbox("Sort by", list(DOC_SORT_OPTIONS), key="doc_sort")
                
-                if st.session_state["admin_docs"]:
-                    documents = st.session_state["admin_docs"].get("documents", [])
-                   
-                    # Apply active status filter
-                    if active_filter != "All":
-                        if active_filter == "Active":
-                            documents = [doc for doc in documents if doc.get('is_active', True)]
-                        else:  # Inactive
-                            documents = [doc for doc in documents if not doc.get('is_active', True)]
+                # Initialize page state; any filter change starts again from page 1
+                if 'doc_page' not in st.session_state:
+                    st.session_state.doc_page = 1
+                if st.session_state.get("doc_filters") != (doc_filters, ITEMS_PER_PAGE, doc_search, doc_sort):
+                    st.session_state.doc_filters = (doc_filters, ITEMS_PER_PAGE, doc_search, doc_sort)
+                    st.session_state.doc_page = 1
+                if st.session_state.doc_page < 1:
+                    st.session_state.doc_page = 1
+               
+                if doc_source == "Local catalogue":
+                    docs_loaded, page_data = get_catalog_page(
+                        headers, doc_filters, st.session_state.doc_page, ITEMS_PER_PAGE, doc_search, doc_sort
+                    )
+                    catalog_stats = get_document_catalog().stats()
+                    sync_col1, sync_col2 = st.columns([4, 1])
+                    with sync_col1:
+                        last_sync = catalog_stats["last_sync_at"].strftime("%H:%M:%S") if catalog_stats["last_sync_at"] else "never"
+                        st.caption(
+                            f"{catalog_stats['documents']} documents held · last sync {last_sync} · "
+                            f"changed since {catalog_stats['watermark'] or '—'} · "
+                            f"{catalog_stats['full_syncs']} full / {catalog_stats['delta_syncs']} delta syncs"
+                        )
+                    with sync_col2:
+                        if st.button("Full resync", key="doc_full_resync", use_container_width=True):
+                            with st.spinner("Reloading the whole catalogue..."):
+                                get_document_catalog().sync(headers, full=True)
+                            st.rerun()
+                else:
+                    docs_loaded, page_data = get_document_page(headers, doc_filters, st.session_state.doc_page, ITEMS_PER_PAGE)
+               
+                with st.expander("📦 Export documents"):
+                    st.caption("Streams every document matching the status, source and active filters from the backend.")
+                    render_export_panel(
+                        "documents", "documents", DOC_EXPORT_COLUMNS,
+                        lambda: iter_admin_documents(headers, doc_filters)
+                    )
+               
+                if docs_loaded:
+                    # Status, source and active filters are applied before paging
+                    documents = page_data["documents"]
+                    doc_summary = page_data["summary"] if "summary" in page_data else get_document_summary(headers, doc_filters)
                    
                     # Pagination setup
-                    ITEMS_PER_PAGE = 25
-                    total_documents = len(documents)
+                    total_documents = page_data["total_count"]
                     total_pages = (total_documents + ITEMS_PER_PAGE - 1) // ITEMS_PER_PAGE
                    
-                    # Initialize page state
-                    if 'doc_page' not in st.session_state:
-                        st.session_state.doc_page = 1
-                   
-                    # Ensure page is within bounds
+                    # Ensure page is within bounds (the catalogue may have shrunk)
                     if st.session_state.doc_page > total_pages and total_pages > 0:
                         st.session_state.doc_page = total_pages
-                    elif st.session_state.doc_page < 1:
-                        st.session_state.doc_page = 1
+                        st.rerun()
+                   
+                    if doc_source == "Server pages" and st.session_state.doc_page < total_pages:
+                        prefetch_document_page(headers, doc_filters, st.session_state.doc_page + 1, ITEMS_PER_PAGE)
                    
                     # Document summary
                     col1, col2, col3 = st.columns(3)
@@ -864,7 +2799,8 @@ if __name__ == "__main__":
                         </div>
                         """, unsafe_allow_html=True)
                     with col2:
-                        active_count = sum(1 for doc in documents if doc.get('is_active', True))
+                        # Counts come from the summary endpoint; shown as "—" when it is unavailable
+                        active_count = doc_summary.get("active", "—") if doc_summary else "—"
                         st.markdown(f"""
                         <div class="metric-container">
                             <h3 style="color: #2ecc71; margin: 0;">{active_count}</h3>
@@ -872,7 +2808,7 @@ if __name__ == "__main__":
                         </div>
                         """, unsafe_allow_html=True)
                     with col3:
-                        processed_count = sum(1 for doc in documents if doc.get('indexing_status') == 'processed')
+                        processed_count = doc_summary.get("processed", "—") if doc_summary else "—"
                         st.markdown(f"""
                         <div class="metric-container">
                             <h3 style="color: #f39c12; margin: 0;">{processed_count}</h3>
@@ -880,6 +2816,54 @@ if __name__ == "__main__":
                         </div>
                         """, unsafe_allow_html=True)
                    
+                    # Follow processing/pending documents in place instead of reloading the table
+                    if st.toggle("👁️ Watch indexing progress", key="doc_watch_enabled"):
+                        watch_candidates = documents
+                        if doc_source == "Local catalogue":
+                            watch_candidates = [
+                                doc for status in DOC_WATCH_STATUSES
+                                for doc in get_document_catalog().query((status, None, None))
+                            ]
+                        doc_watch = start_document_watch(watch_candidates)
+                       
+                        # Ticks at the minimum interval; poll_document_watch() applies the backoff
+                        @st.fragment(run_every=DOC_WATCH_MIN_INTERVAL)
+                        def render_document_watch():
+                            if poll_document_watch(headers):
+                                # Redraw the table from the patched cache
+                                st.rerun()
+                            doc_watch = st.session_state["doc_watch"]
+                            next_poll = max(0, doc_watch["next_poll_at"] - time.monotonic())
+                            st.caption(
+                                f"Watching {len(doc_watch['ids'])} documents · next check in {next_poll:.0f}s "
+                                f"(every {doc_watch['interval']:.0f}s) · {doc_watch['polls']} checks"
+                            )
+                            if doc_watch["error"]:
+                                st.warning(f"⚠️ Status check failed: {doc_watch['error']}")
+                       
+                        if doc_watch["ids"]:
+                            render_document_watch()
+                        else:
+                            st.caption("No documents are processing or pending.")
+                        for finished in doc_watch["finished"][-5:]:
+                            icon = "✅" if finished["status"] == "processed" else "❌" if finished["status"] == "failed" else "ℹ️"
+                            st.caption(f"{icon} {finished['id']} → {finished['status']} at {finished['at']}")
+                    else:
+                        st.session_state["doc_watch"] = None
+                   
+                    # Outcome of the last bulk action; shown even when it emptied the page
+                    bulk_report = st.session_state.get("doc_bulk_report")
+                    if bulk_report:
+                        outcome_counts = {}
+                        for row in bulk_report:
+                            outcome_counts[row["outcome"]] = outcome_counts.get(row["outcome"], 0) + 1
+                        summary_text = ", ".join(f"{count} {outcome}" for outcome, count in outcome_counts.items())
+                        with st.expander(f"Last bulk {bulk_report[0]['action']}: {summary_text}", expanded=True):
+                            st.dataframe(bulk_report, use_container_width=True, hide_index=True)
+                            if st.button("Dismiss report", key="dismiss_bulk_report"):
+                                st.session_state["doc_bulk_report"] = None
+                                st.rerun()
+                   
                     if documents:
                         # Pagination controls at top
                         if total_pages > 1:
@@ -915,162 +2899,228 @@ if __name__ == "__main__":
                                     st.session_state.doc_page = total_pages
                                     st.rerun()
                        
-                        # Calculate pagination
+                        # Rows for this page came straight from the server
                         start_idx = (st.session_state.doc_page - 1) * ITEMS_PER_PAGE
-                        end_idx = start_idx + ITEMS_PER_PAGE
-                        page_documents = documents[start_idx:end_idx]
+                        end_idx = start_idx + len(documents)
+                        page_documents = documents
                        
-                        #table
-                        st.markdown("### 📋 Document Table")
-                        st.markdown("""
-                        <div class="professional-table">
-                            <div class="table-header">
-                                <div style="display: grid; grid-template-columns: 3fr 2fr 1fr 1fr 1fr 1fr; gap: 1rem; align-items: center;">
-                                    <div><strong>Title</strong></div>
-                                    <div><strong>Source</strong></div>
-                                    <div><strong>Status</strong></div>
-                                    <div><strong>Active</strong></div>
-                                    <div><strong>Updated</strong></div>
-                                    <div><strong>Action</strong></div>
+                        if doc_view == "Grid":
+                            # One widget for the whole page: the data editor virtualises
+                            # scrolling in the browser, so element count stays flat
+                            st.markdown("### 📋 Document Grid")
+                            # Selection widgets are keyed on everything that decides which rows
+                            # are shown, so a page, size or filter change never carries a
+                            # selection (or an armed Delete) over to other rows
+                            grid_key = (
+                                f"{st.session_state.doc_page}_{ITEMS_PER_PAGE}_"
+                                f"{hashlib.sha1(repr(st.session_state.doc_filters).encode()).hexdigest()[:12]}_"
+                                f"{st.session_state.get('doc_grid_version', 0)}"
+                            )
+                            grid_rows = [
+                                {
+                                    "select": False,
+                                    "id": doc.get('id'),
+                                    "title": doc.get('title', 'Untitled'),
+                                    "page_url": doc.get('page_url'),
+                                    "source": doc.get('source', 'N/A'),
+                                    "status": doc.get('indexing_status', 'Unknown'),
+                                    "is_active": doc.get('is_active', True),
+                                    "updated": doc.get('_updated_display', 'N/A'),
+                                    "error": (doc.get('error_message') or "")[:80],
+                                }
+                                for doc in page_documents
+                            ]
+                            edited_rows = st.data_editor(
+                                grid_rows,
+                                key=f"doc_grid_{grid_key}",
+                                height=DOC_GRID_HEIGHT,
+                                use_container_width=True,
+                                hide_index=True,
+                                column_order=["select", "title", "page_url", "source", "status", "is_active", "updated", "error"],
+                                disabled=["id", "title", "page_url", "source", "status", "is_active", "updated", "error"],
+                                column_config={
+                                    "select": st.column_config.CheckboxColumn("Select", width="small"),
+                                    "title": st.column_config.TextColumn("Title", width="large"),
+                                    "page_url": st.column_config.LinkColumn("Link", display_text="Open", width="small"),
+                                    "source": st.column_config.TextColumn("Source"),
+                                    "status": st.column_config.TextColumn("Status", width="small"),
+                                    "is_active": st.column_config.CheckboxColumn("Active", width="small"),
+                                    "updated": st.column_config.TextColumn("Updated", width="small"),
+                                    "error": st.column_config.TextColumn("Error"),
+                                }
+                            )
+                            selected_docs = [row for row in edited_rows if row.get("select")]
+
+                            # Bulk actions over the rows ticked in the grid
+                            action_col1, action_col2, action_col3, action_col4, action_col5 = st.columns([2, 1, 1, 1, 1])
+                            with action_col1:
+                                select_all = st.checkbox("Select all on page", key=f"grid_select_all_{grid_key}")
+                                if select_all:
+                                    selected_docs = grid_rows
+                                st.caption(f"{len(selected_docs)} of {len(grid_rows)} rows selected")
+                            with action_col2:
+                                activate_clicked = st.button(
+                                    "Activate", key="grid_activate_selected",
+                                    disabled=not selected_docs, use_container_width=True
+                                )
+                            with action_col3:
+                                deactivate_clicked = st.button(
+                                    "Deactivate", key="grid_deactivate_selected",
+                                    disabled=not selected_docs, use_container_width=True
+                                )
+                            with action_col4:
+                                confirm_delete = st.checkbox("Confirm delete", key=f"grid_confirm_delete_{grid_key}")
+                            with action_col5:
+                                delete_clicked = st.button(
+                                    "Delete", key="grid_delete_selected", type="tertiary",
+                                    disabled=not (selected_docs and confirm_delete), use_container_width=True
+                                )
+                            bulk_action = (
+                                "activate" if activate_clicked
+                                else "deactivate" if deactivate_clicked
+                                else "delete" if delete_clicked
+                                else None
+                            )
+                            if bulk_action:
+                                with st.spinner(f"Applying {bulk_action} to {len(selected_docs)} documents..."):
+                                    bulk_report = bulk_update_documents(headers, bulk_action, selected_docs)
+                                # Keep the report across the rerun; patch the cached pages for the
+                                # rows that succeeded and re-read the page in the background
+                                st.session_state["doc_bulk_report"] = bulk_report
+                                done_ids = [row["id"] for row in bulk_report if row["outcome"] == "ok"]
+                                if bulk_action == "delete":
+                                    apply_document_changes(deleted_ids=done_ids)
+                                else:
+                                    apply_document_changes(toggled={doc_id: bulk_action == "activate" for doc_id in done_ids})
+                                schedule_document_reconcile(headers, doc_filters, st.session_state.doc_page, ITEMS_PER_PAGE)
+                                st.rerun()
+                           
+                        else:
+                            #table
+                            st.markdown("### 📋 Document Table")
+                            st.markdown("""
+                            <div class="professional-table">
+                                <div class="table-header">
+                                    <div style="display: grid; grid-template-columns: 3fr 2fr 1fr 1fr 1fr 1fr; gap: 1rem; align-items: center;">
+                                        <div><strong>Title</strong></div>
+                                        <div><strong>Source</strong></div>
+                                        <div><strong>Status</strong></div>
+                                        <div><strong>Active</strong></div>
+                                        <div><strong>Updated</strong></div>
+                                        <div><strong>Action</strong></div>
+                                    </div>
                                 </div>
                             </div>
-                        </div>
-                        """, unsafe_allow_html=True)
-                       
-                        # Document rows
-                        for i, doc in enumerate(page_documents):
-                            # Determine row styling based on status
-                            status = doc.get('indexing_status', 'Unknown')
-                            is_active = doc.get('is_active', True)
-                           
-                            row_style = "background: #f8f9fa;" if i % 2 == 0 else "background: white;"
-                            if status == 'failed':
-                                row_style += " border-left: 4px solid #e74c3c;"
-                            elif status == 'processing':
-                                row_style += " border-left: 4px solid #f39c12;"
-                            elif status == 'processed' and is_active:
-                                row_style += " border-left: 4px solid #2ecc71;"
-                           
-                            st.markdown(f"""
-                            <div class="table-row" style="{row_style}">
-                                <div style="display: grid; grid-template-columns: 3fr 2fr 1fr 1fr 1fr 1fr; gap: 1rem; align-items: center; padding: 0.75rem;">
                             """, unsafe_allow_html=True)
                            
-                            # Create columns for this row
-                            doc_cols = st.columns([3, 2, 1, 1, 1, 1])
-                           
-                            with doc_cols[0]:
-                                # Title with URL link
-                                title = doc.get('title', 'Untitled')
-                                display_title = title[:45] + ("..." if len(title) > 45 else "")
-                               
-                                if doc.get('page_url'):
-                                    st.markdown(f"🔗 [{display_title}]({doc['page_url']})")
-                                else:
-                                    st.markdown(f"📄 {display_title}")
-                               
-                                # Show error message if exists
-                                if doc.get('error_message'):
-                                    st.error(f"❌ {doc['error_message'][:80]}...")
-                           
-                            with doc_cols[1]:
-                                source = doc.get('source', 'N/A')
-                                st.markdown(f"🏷️ {source[:20]}{'...' if len(source) > 20 else ''}")
-                           
-                            with doc_cols[2]:
+                            # Document rows
+                            for i, doc in enumerate(page_documents):
+                                # Determine row styling based on status
                                 status = doc.get('indexing_status', 'Unknown')
-                                if status == 'processed':
-                                    st.success(f"✅ {status}")
-                                elif status == 'processing':
-                                    st.info(f"⏳ {status}")
-                                elif status == 'failed':
-                                    st.error(f"❌ {status}")
-                                else:
-                                    st.markdown(f"✅ {status}")
-                           
-                            with doc_cols[3]:
                                 is_active = doc.get('is_active', True)
-                                if is_active:
-                                    st.markdown("🟢 Active")
-                                else:
-                                    st.error("🔴 Inactive")
-                           
-                            with doc_cols[4]:
-                                updated = doc.get('last_updated_at', 'N/A')
-                                if updated != 'N/A':
-                                    try:
-                                        from datetime import datetime
-                                        if isinstance(updated, str):
-                                            dt = datetime.fromisoformat(updated.replace('Z', '+00:00'))
-                                            st.write(f"📅 {dt.strftime('%m/%d')}")
-                                        else:
-                                            st.write(f"📅 {str(updated)[:10]}")
-                                    except:
-                                        st.write(f"📅 {str(updated)[:10]}")
-                                else:
-                                    st.write('📅 N/A')
-                           
-                            with doc_cols[5]:
-                                #toggle button
-                                current_status = doc.get('is_active', True)
-                                button_text = "Deactivate" if current_status else "Activate"
-                                button_type = "secondary" if current_status else "primary"
                                
-                                if st.button(button_text, key=f"toggle_{doc.get('id')}_{start_idx + i}", type=button_type, use_container_width=True):
+                                row_style = "background: #f8f9fa;" if i % 2 == 0 else "background: white;"
+                                if status == 'failed':
+                                    row_style += " border-left: 4px solid #e74c3c;"
+                                elif status == 'processing':
+                                    row_style += " border-left: 4px solid #f39c12;"
+                                elif status == 'processed' and is_active:
+                                    row_style += " border-left: 4px solid #2ecc71;"
+                               
+                                st.markdown(f"""
+                                <div class="table-row" style="{row_style}">
+                                    <div style="display: grid; grid-template-columns: 3fr 2fr 1fr 1fr 1fr 1fr; gap: 1rem; align-items: center; padding: 0.75rem;">
+                                """, unsafe_allow_html=True)
+                               
+                                # Create columns for this row
+                                doc_cols = st.columns([3, 2, 1, 1, 1, 1])
+                               
+                                with doc_cols[0]:
+                                    # Title with URL link
+                                    title = doc.get('title', 'Untitled')
+                                    display_title = title[:45] + ("..." if len(title) > 45 else "")
+                                   
+                                    if doc.get('page_url'):
+                                        st.markdown(f"🔗 [{display_title}]({doc['page_url']})")
+                                    else:
+                                        st.markdown(f"📄 {display_title}")
+                                   
+                                    # Show error message if exists
+                                    if doc.get('error_message'):
+                                        st.error(f"❌ {doc['error_message'][:80]}...")
+                               
+                                with doc_cols[1]:
+                                    source = doc.get('source', 'N/A')
+                                    st.markdown(f"🏷️ {source[:20]}{'...' if len(source) > 20 else ''}")
+                               
+                                with doc_cols[2]:
+                                    status = doc.get('indexing_status', 'Unknown')
+                                    if status == 'processed':
+                                        st.success(f"✅ {status}")
+                                    elif status == 'processing':
+                                        st.info(f"⏳ {status}")
+                                    elif status == 'failed':
+                                        st.error(f"❌ {status}")
+                                    else:
+                                        st.markdown(f"✅ {status}")
+                               
+                                with doc_cols[3]:
+                                    is_active = doc.get('is_active', True)
+                                    if is_active:
+                                        st.markdown("🟢 Active")
+                                    else:
+                                        st.error("🔴 Inactive")
+                               
+                                with doc_cols[4]:
+                                    st.write(f"📅 {doc.get('_updated_display', 'N/A')}")
+                               
+                                with doc_cols[5]:
+                                    #toggle button
+                                    current_status = doc.get('is_active', True)
+                                    button_text = "Deactivate" if current_status else "Activate"
+                                    button_type = "secondary" if current_status else "primary"
+                                   
+                                    if st.button(button_text, key=f"toggle_{doc.get('id')}_{start_idx + i}", type=button_type, use_container_width=True):
+                                        try:
+                                            with st.spinner("Updating document status..."):
+                                                success, result = toggle_document_active(headers, doc['id'])
+                                                if success:
+                                                    new_status = "activated" if result.get('is_active') else "deactivated"
+                                                    st.success(f"✅ Document {new_status} successfully!")
+                                                   
+                                                    if result.get('database_found') is False:
+                                                        st.warning("⚠️ Document not found in database but configuration updated")
+     
+                                                    apply_document_changes(toggled={doc['id']: result.get('is_active', not current_status)})
+                                                    schedule_document_reconcile(headers, doc_filters, st.session_state.doc_page, ITEMS_PER_PAGE)
+                                                    st.rerun()
+                                                else:
+                                                    st.error(f"❌ Failed to toggle status: {result}")
+                                        except Exception as e:
+                                            st.error(f"❌ Error: {str(e)}")
+
+# Delete button
+                               
+                                if st.button("Delete", key=f"delete_{doc.get('id')}_{start_idx + i}", type="tertiary", use_container_width=True):
                                     try:
-                                        session = get_requests_session()
-                                        doc_id = doc['id']
-                                       
-                                        with st.spinner("Updating document status..."):
-                                            response = session.put(
-                                                f"{API_BASE_URL}/admin/documents/{doc_id}/toggle-active",
-                                                headers=headers,
-                                                timeout=30
-                                            )
-                                            if response.status_code == 200:
-                                                result = response.json()
-                                                new_status = "activated" if result.get('is_active') else "deactivated"
-                                                st.success(f"✅ Document {new_status} successfully!")
-                                               
-                                                if result.get('database_found') is False:
-                                                    st.warning("⚠️ Document not found in database but configuration updated")
- 
-                                                st.session_state['admin_docs'] = None
+                                        with st.spinner("Deleting document..."):
+                                            success, result = delete_document(headers, doc['id'])
+                                            if success:
+                                                st.success(result.get("message", "✅ Document deleted successfully!"))
+                                                apply_document_changes(deleted_ids=[doc['id']])
+                                                schedule_document_reconcile(headers, doc_filters, st.session_state.doc_page, ITEMS_PER_PAGE)
                                                 st.rerun()
                                             else:
-                                                st.error(f"❌ Failed to toggle status: {response.text}")
+                                                st.error(f"❌ Failed to delete document: {result}")
                                     except Exception as e:
                                         st.error(f"❌ Error: {str(e)}")
-
-# Delete button
-                           
-                            if st.button("Delete", key=f"delete_{doc.get('id')}_{start_idx + i}", type="tertiary", use_container_width=True):
-                                try:
-                                    with st.spinner("Deleting document..."):
-                                        session = get_requests_session()
-                                        response = session.delete(
-                                            f"{API_BASE_URL}/admin/documents/{doc['id']}",
-                                            headers=headers
-                                        )
-                                        if response.status_code == 200:
-                                            st.success(response.json().get("message", "✅ Document deleted successfully!"))
-                                            # get_admin_documents_cached.clear()
-                                            st.rerun()
-                                        elif response.status_code == 404:
-                                            st.error(response.json().get("detail", "❌ Document not found"))
-                                        elif response.status_code == 500:
-                                            st.error(response.json().get("detail", "❌ Failed to delete document due to server error"))
-                                        else:
-                                            st.error(f"❌ Unexpected error: {response.text}")
-                                except Exception as e:
-                                    st.error(f"❌ Error: {str(e)}")
- 
-                            st.markdown("</div></div>", unsafe_allow_html=True)
+     
+                                st.markdown("</div></div>", unsafe_allow_html=True)
+                               
+                                # Add subtle separator
+                                if i < len(page_documents) - 1:
+                                    st.markdown('<hr style="margin: 0.5rem 0; border: none; border-top: 1px solid #e9ecef;">', unsafe_allow_html=True)
                            
-                            # Add subtle separator
-                            if i < len(page_documents) - 1:
-                                st.markdown('<hr style="margin: 0.5rem 0; border: none; border-top: 1px solid #e9ecef;">', unsafe_allow_html=True)
-                       
                         # Pagination controls at bottom (if more than one page)
                         if total_pages > 1:
                             st.markdown("---")
@@ -1092,9 +3142,10 @@ if __name__ == "__main__":
                         </div>
                         """, unsafe_allow_html=True)
                 else:
-                    st.error(f"❌ Failed to load documents")
+                    st.error(f"❌ Failed to load documents: {page_data}")
+                render_profiler.checkpoint("admin_documents")
            
-            with admin_tab2:
+            elif admin_section == "🛡️ Safety":
                 st.markdown("""
                 <div style="background: linear-gradient(135deg, #FFA500 0%, #FF4500 100%);
                         color: white; padding: 1.5rem; border-radius: 15px; margin-bottom: 2rem;">
@@ -1121,43 +3172,119 @@ if __name__ == "__main__":
                 with col3:
                     time_filter = st.selectbox(
                         "⏰ Time Range",
-                        ["All Time", "Last 24h", "Last 7d", "Last 30d"],
+                        list(SAFETY_TIME_WINDOWS),
                         key="safety_time_filter"
                     )
                 with col4:
                     if st.button("🔄 Refresh", use_container_width=True):
                         st.session_state['safety_logs'] = None
+                        st.session_state['safety_summary'] = None
+                        st.session_state['safety_cursors'] = [None]
                         st.rerun()
                
                 # Get safety logs
                 categories_param = None if categories_filter == "All" else categories_filter
                 severity_param = None if severity_filter == "All" else severity_filter
                
-                success, safety_data = get_admin_safety_logs(headers, categories_param, severity_param)
-                if success:
-                    st.session_state['safety_logs'] = safety_data
-                if success:
-                    safety_logs = st.session_state['safety_logs'].get("safety_logs", [])
-                    total_count = st.session_state['safety_logs'].get("total_count", 0)
- 
-                    # Safety logs display
-                    st.markdown(f"### 🛡️ Safety Logs ({total_count} total)")
-                    for log in safety_logs:
-                        st.markdown(f"""
-                        <div style="border: 2px solid #3498db; border-radius: 10px; padding: 1rem; margin-bottom: 1rem;">
-                            <strong>Log ID:</strong> {log['id']}<br>
-                            <strong>Chat ID:</strong> {log['chat_id']}<br>
-                            <strong>Categories:</strong> {log['categories']}<br>
-                            <strong>Severity:</strong> {log['severity']}<br>
-                            <strong>PII Details:</strong> {log['pii_details']}<br>
-                            <strong>Created Date:</strong> {log['created_date']}
-                        </div>
-                        """, unsafe_allow_html=True)
+                safety_view = st.radio(
+                    "Safety view", ["Logs", "Summary"],
+                    horizontal=True, key="safety_view_mode", label_visibility="collapsed"
+                )
+               
+                if safety_view == "Summary":
+                    # Counts over the whole window without rendering individual logs
+                    success, safety_summary, summary_source = get_safety_analytics(
+                        headers, categories_param, severity_param, time_filter
+                    )
+                    if success:
+                        summary_col1, summary_col2, summary_col3 = st.columns(3)
+                        summary_col1.metric("Events", safety_summary.get("total", 0))
+                        by_day = safety_summary.get("by_day") or {}
+                        summary_col2.metric("Busiest day", max(by_day, key=by_day.get) if by_day else "—")
+                        summary_col3.metric("Days with events", len(by_day))
+                        if summary_source == "local":
+                            st.caption(
+                                "Rolled up locally from the raw logs; the backend has no summary endpoint."
+                                + (f" Stopped after {SAFETY_ROLLUP_MAX_LOGS} logs." if safety_summary.get("truncated") else "")
+                            )
+                       
+                        st.markdown("#### Events per day")
+                        if by_day:
+                            st.bar_chart(pd.DataFrame({"events": pd.Series(by_day)}))
+                        else:
+                            st.info("No safety events in this window.")
+                        chart_col1, chart_col2 = st.columns(2)
+                        with chart_col1:
+                            st.markdown("#### By category")
+                            if safety_summary.get("by_category"):
+                                st.bar_chart(pd.DataFrame({"events": pd.Series(safety_summary["by_category"])}))
+                        with chart_col2:
+                            st.markdown("#### By severity")
+                            if safety_summary.get("by_severity"):
+                                st.bar_chart(pd.DataFrame({"events": pd.Series(safety_summary["by_severity"])}))
+                    else:
+                        st.error(f"❌ Failed to load safety summary: {safety_summary}")
                 else:
-                    st.error(f"❌ Failed to load safety logs: {safety_data}")
+                    # Cursors of the pages visited so far; the last one is on screen.
+                    # Any filter change starts again from the first page.
+                    safety_filters = (categories_param, severity_param, time_filter)
+                    if st.session_state.get("safety_filters") != safety_filters or not st.session_state.get("safety_cursors"):
+                        st.session_state["safety_filters"] = safety_filters
+                        st.session_state["safety_cursors"] = [None]
+                    safety_cursors = st.session_state["safety_cursors"]
+                   
+                    with st.expander("📦 Export safety logs"):
+                        st.caption("Streams every log matching the filters and time range from the backend.")
+                        render_export_panel(
+                            "safety_logs", "safety_logs", SAFETY_EXPORT_COLUMNS,
+                            lambda: iter_safety_logs(headers, categories_param, severity_param, safety_window_start(time_filter))
+                        )
+                   
+                    # Served from the session cache until the TTL lapses or Refresh is pressed
+                    success, safety_data, fetched_at = get_safety_log_page(
+                        headers, categories_param, severity_param, time_filter, safety_cursors[-1]
+                    )
+                    if success:
+                        safety_logs = safety_data.get("safety_logs", [])
+                        total_count = safety_data.get("total_count")
+                        page_number = len(safety_cursors)
+                        # A backend paging by offset without a total leaves the page count open
+                        total_pages = max(1, (total_count + SAFETY_PAGE_SIZE - 1) // SAFETY_PAGE_SIZE) if total_count is not None else "?"
+     
+                        # Safety logs display - only the current page is rendered
+                        st.markdown(f"### 🛡️ Safety Logs ({total_count if total_count is not None else '?'} total)")
+                        st.caption(f"Fetched at {fetched_at.strftime('%H:%M:%S')} · cached for {SAFETY_LOG_TTL}s")
+                        nav_col1, nav_col2, nav_col3 = st.columns([1, 2, 1])
+                        with nav_col1:
+                            if st.button("◀️ Previous", key="safety_prev", disabled=page_number == 1, use_container_width=True):
+                                safety_cursors.pop()
+                                st.rerun()
+                        with nav_col2:
+                            st.markdown(
+                                f"<div style='text-align: center; padding: 0.5rem;'><strong>Page {page_number} of {total_pages}</strong></div>",
+                                unsafe_allow_html=True
+                            )
+                        with nav_col3:
+                            if st.button("Next ▶️", key="safety_next", disabled=not safety_data.get("next_cursor"), use_container_width=True):
+                                safety_cursors.append(safety_data["next_cursor"])
+                                st.rerun()
+                        for log in safety_logs:
+                            st.markdown(f"""
+                            <div style="border: 2px solid #3498db; border-radius: 10px; padding: 1rem; margin-bottom: 1rem;">
+                                <strong>Log ID:</strong> {log['id']}<br>
+                                <strong>Chat ID:</strong> {log['chat_id']}<br>
+                                <strong>Categories:</strong> {log['categories']}<br>
+                                <strong>Severity:</strong> {log['severity']}<br>
+                                <strong>PII Details:</strong> {log['pii_details']}<br>
+                                <strong>Created Date:</strong> {log['created_date']}
+                            </div>
+                            """, unsafe_allow_html=True)
+                    else:
+                        st.error(f"❌ Failed to load safety logs: {safety_data}")
+                render_profiler.checkpoint("admin_safety")
  
  
-            with admin_tab3:
+            elif admin_section == "➕ Add Document":
                 st.markdown("""
                 <div style="background: linear-gradient(135deg, #FFA500 0%, #FF4500 100%);
                         color: white; padding: 1.5rem; border-radius: 15px; margin-bottom: 2rem;">
@@ -1166,35 +3293,105 @@ if __name__ == "__main__":
                 </div>
                 """, unsafe_allow_html=True)
                
-                # Admin Document Submission Form
-                st.markdown("### Add a new document to the system")
-               
-                # Input fields
-                doc_id = st.text_input("Document ID", placeholder="Enter unique document ID")
-                # resource_name = st.text_input("Resource Name", placeholder="Enter resource name (e.g., Confluence, VQD)")
-                resource_name = st.selectbox(
-                                "Resource Name",
-                                options=["Confluence", "VQD", "Sharepoint", "ServiceNow", "Other"],  # Add more options as needed
-                                help="Select a resource name from the dropdown"
+                add_mode = st.radio(
+                    "Mode", ["Single document", "Bulk upload"],
+                    horizontal=True, key="add_doc_mode", label_visibility="collapsed"
                 )
-                page_url = st.text_input("Document Link", placeholder="Enter the document link")
-                # admin_email = st.text_input("Admin Email", placeholder="Enter your email")
                
-                # Submit button
-                if st.button("Submit Document"):
-                    if doc_id and resource_name and page_url:
-                        try:
-                            response = add_document(doc_id, resource_name, page_url)
-                            st.success(f"Document added successfully! Response: {response}")
-                        except Exception as e:
-                            st.error(f"Error adding document: {str(e)}")
-                    else:
-                        st.error("All fields are required!")
+                if add_mode == "Single document":
+                    # Admin Document Submission Form
+                    st.markdown("### Add a new document to the system")
+                   
+                    # Input fields
+                    doc_id = st.text_input("Document ID", placeholder="Enter unique document ID")
+                    resource_name = st.selectbox(
+                                    "Resource Name",
+                                    options=RESOURCE_NAMES,
+                                    help="Select a resource name from the dropdown"
+                    )
+                    page_url = st.text_input("Document Link", placeholder="Enter the document link")
+                   
+                    # Submit button
+                    if st.button("Submit Document"):
+                        if doc_id and resource_name and page_url:
+                            try:
+                                response = add_document(doc_id, resource_name, page_url)
+                                if response is not None:
+                                    st.success(f"Document added successfully! Response: {response}")
+                            except Exception as e:
+                                st.error(f"Error adding document: {str(e)}")
+                        else:
+                            st.error("All fields are required!")
+                else:
+                    st.markdown("### Upload many documents at once")
+                    st.caption(
+                        "CSV with a header row, or JSON Lines with one object per line, "
+                        f"with the fields doc_id, resource_name and page_url (up to {INGEST_MAX_ROWS} rows)."
+                    )
+                    upload = st.file_uploader("Document list", type=["csv", "jsonl", "json"], key="ingest_upload")
+                    if upload is not None:
+                        upload_rows, upload_errors = parse_document_upload(upload.name, upload.getvalue())
+                        st.markdown(f"**{len(upload_rows)}** valid rows · **{len(upload_errors)}** rejected")
+                        if upload_errors:
+                            with st.expander(f"⚠️ {len(upload_errors)} rows failed validation", expanded=not upload_rows):
+                                st.dataframe(upload_errors, use_container_width=True, hide_index=True)
+                        if upload_rows:
+                            st.dataframe(upload_rows[:20], use_container_width=True, hide_index=True)
+                            if st.button(f"Submit {len(upload_rows)} documents", type="primary", key="ingest_submit"):
+                                progress = st.progress(0.0, text="Submitting documents...")
+                                start_time = time.perf_counter()
+                                results = ingest_documents(
+                                    headers, upload_rows,
+                                    on_progress=lambda done, total: progress.progress(done / total, text=f"Submitted {done}/{total}")
+                                )
+                                st.session_state["ingest_results"] = results
+                                st.session_state["ingest_run"] = (len(upload_rows), time.perf_counter() - start_time)
+                                st.session_state["admin_docs"] = None
+                                st.rerun()
+                   
+                    ingest_results = st.session_state.get("ingest_results")
+                    if ingest_results:
+                        failed_rows = [row for row in ingest_results if row["outcome"] != "ok"]
+                        # Throughput of the most recent submit or retry pass
+                        run_count, elapsed = st.session_state.get("ingest_run") or (0, 0)
+                        latencies = sorted(row["seconds"] for row in ingest_results)
+                        stat_cols = st.columns(4)
+                        stat_cols[0].metric("Submitted", len(ingest_results) - len(failed_rows))
+                        stat_cols[1].metric("Failed", len(failed_rows))
+                        stat_cols[2].metric("Throughput", f"{run_count / elapsed:.1f}/s" if elapsed else "—")
+                        stat_cols[3].metric("Median latency", f"{latencies[len(latencies) // 2] * 1000:.0f} ms")
+                        st.dataframe(failed_rows or ingest_results, use_container_width=True, hide_index=True)
+                       
+                        result_col1, result_col2, result_col3 = st.columns(3)
+                        with result_col1:
+                            if st.button(f"🔁 Retry {len(failed_rows)} failed", disabled=not failed_rows, use_container_width=True):
+                                progress = st.progress(0.0, text="Retrying failed documents...")
+                                start_time = time.perf_counter()
+                                retried = ingest_documents(
+                                    headers, failed_rows,
+                                    on_progress=lambda done, total: progress.progress(done / total, text=f"Retried {done}/{total}")
+                                )
+                                retried_by_id = {row["doc_id"]: row for row in retried}
+                                st.session_state["ingest_results"] = [retried_by_id.get(row["doc_id"], row) for row in ingest_results]
+                                st.session_state["ingest_run"] = (len(failed_rows), time.perf_counter() - start_time)
+                                st.session_state["admin_docs"] = None
+                                st.rerun()
+                        with result_col2:
+                            st.download_button(
+                                "📥 Download results",
+                                data=results_to_csv(ingest_results, ["doc_id", "resource_name", "page_url", "outcome", "detail", "seconds"]),
+                                file_name=f"ingest_results_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
+                                mime="text/csv",
+                                use_container_width=True
+                            )
+                        with result_col3:
+                            if st.button("Clear results", use_container_width=True):
+                                st.session_state["ingest_results"] = None
+                                st.rerun()
+                render_profiler.checkpoint("admin_add_document")
  
             # Admin Tab 4: Manage Tabular Data
-            # admin_tab4 = st.tab("📋 Manage Process Owners")
- 
-            with admin_tab4:
+            elif admin_section == "📋 Manage Process Owners":
                 st.markdown("""
                 <div style="background: linear-gradient(135deg, #FFA500 0%, #FF4500 100%);
                         color: white; padding: 1.5rem; border-radius: 15px; margin-bottom: 2rem;">
@@ -1214,7 +3411,7 @@ if __name__ == "__main__":
                 # Fetch data from the backend
                 if st.button("Fetch Data"):
                     try:
-                        response = requests.get(f"{API_BASE_URL}/admin/process-owners", headers=headers, timeout=60)
+                        response = api_request("GET", "/admin/process-owners", headers=headers)
                         if response.status_code == 200:
                             data = response.json()  # Assuming the backend returns JSON data
                             st.success("Data fetched successfully!")
@@ -1236,11 +3433,11 @@ if __name__ == "__main__":
                             for row in editable_data:
                                 owner_id = row.get("id")
                                 if owner_id:  # Update existing row
-                                    update_response = requests.put(
-                                        f"{API_BASE_URL}/admin/process-owners/{owner_id}",
+                                    update_response = api_request(
+                                        "PUT",
+                                        f"/admin/process-owners/{owner_id}",
                                         json=row,
-                                        headers=headers,
-                                        timeout=60
+                                        headers=headers
                                     )
                                     if update_response.status_code == 200:
                                         st.success(f"Row with ID {owner_id} updated successfully!")
@@ -1273,7 +3470,7 @@ if __name__ == "__main__":
                                 "Comments": comments
                             }
                             try:
-                                add_response = requests.post(f"{API_BASE_URL}/admin/process-owners", json=new_row, headers=headers, timeout=60)
+                                add_response = api_request("POST", "/admin/process-owners", json=new_row, headers=headers)
                                 if add_response.status_code == 200:
                                     st.success("New row added successfully!")
                                 else:
@@ -1289,7 +3486,7 @@ if __name__ == "__main__":
                 if st.button("Delete Row"):
                     if delete_id:
                         try:
-                            delete_response = requests.delete(f"{API_BASE_URL}/admin/process-owners/{delete_id}", headers=headers, timeout=60)
+                            delete_response = api_request("DELETE", f"/admin/process-owners/{delete_id}", headers=headers)
                             if delete_response.status_code == 200:
                                 st.success(f"Row with ID {delete_id} deleted successfully!")
                             else:
@@ -1298,6 +3495,7 @@ if __name__ == "__main__":
                             st.error(f"Error deleting row: {str(e)}")
                     else:
                         st.error("Please enter a valid row ID to delete.")
+                render_profiler.checkpoint("admin_process_owners")
        
  
         #Sidebar with only FAQs and Feedback
@@ -1311,7 +3509,77 @@ if __name__ == "__main__":
                     <p style="margin: -0.9rem 0 0 0; opacity: 0.9;">{}</p>
                 </div>
                 """.format(user_email), unsafe_allow_html=True)
+
+                with st.expander("🔌 Connection Pool", expanded=False):
+                    pool_stats = get_pool_stats()
+                    if pool_stats:
+                        st.dataframe(pool_stats, use_container_width=True, hide_index=True)
+                    else:
+                        st.caption("No pooled connections yet")
+                    cache_stats = get_shared_cache().stats()
+                    st.caption(
+                        f"Shared cache: {cache_stats['entries']} entries · {cache_stats['hits']} hits · "
+                        f"{cache_stats['misses']} misses · {cache_stats['coalesced']} coalesced"
+                    )
+                    coalescing_stats = get_coalescing_stats()
+                    st.caption(
+                        f"In-flight GETs: {coalescing_stats['issued']} issued · "
+                        f"{coalescing_stats['deduplicated']} deduplicated"
+                    )
+
+                with st.expander("⏱️ Backend Latency", expanded=False):
+                    metrics_registry = get_metrics_registry()
+                    latency_rows = metrics_registry.summary()
+                    if latency_rows:
+                        latency_rows.sort(key=lambda row: row["total_s"], reverse=True)
+                        st.dataframe(latency_rows, use_container_width=True, hide_index=True)
+                    else:
+                        st.caption("No backend calls recorded yet")
+                    st.download_button(
+                        "Download Prometheus metrics",
+                        data=metrics_registry.render_prometheus(),
+                        file_name="gsc_frontend_metrics.prom",
+                        mime="text/plain",
+                        use_container_width=True
+                    )
+
+                with st.expander("🧪 Render Profiler", expanded=False):
+                    render_profiler.enabled = st.checkbox(
+                        "Profile reruns",
+                        value=render_profiler.enabled,
+                        key="render_profiling_enabled",
+                        help="Record per-section timings for every rerun of this session"
+                    )
+                    if render_profiler.runs:
+                        last_run = render_profiler.runs[-1]
+                        st.caption(
+                            f"Last rerun: {last_run['total_ms']} ms at {last_run['started_at']}"
+                            f"{' (interrupted)' if last_run['interrupted'] else ''}"
+                        )
+                        st.dataframe(
+                            [{"section": name, "ms": ms} for name, ms in last_run["sections"].items()],
+                            use_container_width=True,
+                            hide_index=True
+                        )
+                        if last_run["nested"] or last_run["backend"]:
+                            st.dataframe(
+                                [{"nested": name, "ms": ms} for name, ms in last_run["nested"].items()]
+                                + [{"nested": f"backend: {name}", "ms": ms} for name, ms in last_run["backend"].items()],
+                                use_container_width=True,
+                                hide_index=True
+                            )
+                        st.download_button(
+                            "Download profile (JSON)",
+                            data=render_profiler.to_json(),
+                            file_name="render_profile.json",
+                            mime="application/json",
+                            use_container_width=True
+                        )
+                    elif render_profiler.enabled:
+                        st.caption("Timings appear after the next rerun")
  
+        render_profiler.checkpoint("sidebar_admin_tools")
+
         # Main app logic - show admin panel or regular chat with mode management
         if is_admin and st.sidebar.button("Admin Panel", use_container_width=True):
             # Save current chat messages and switch to admin mode
@@ -1348,7 +3616,8 @@ if __name__ == "__main__":
                 if not st.session_state["faqs"]:
                     headers = {"Authorization": f"Bearer {st.session_state['access_token']}"}
                     status, top_questions = get_top_questions(headers)
-                    st.session_state["faqs"] = top_questions
+                    if status:
+                        st.session_state["faqs"] = top_questions
                
                 if status:
                     # Add CSS for uniform FAQ button widths using containers
@@ -1391,6 +3660,7 @@ if __name__ == "__main__":
                     st.sidebar.info("No FAQs available at the moment.")
             except Exception as e:
                 st.sidebar.warning("FAQs temporarily unavailable")
+            render_profiler.checkpoint("sidebar_faqs")
  
  
         # Backend-only session creation function
@@ -1409,8 +3679,7 @@ if __name__ == "__main__":
                     st.stop()
                
                 headers = {"Authorization": f"Bearer {token}"}
-                session = get_requests_session()
-                response = session.post(f"{API_BASE_URL}/sessions", headers=headers, timeout=60)
+                response = api_request("POST", "/sessions", headers=headers)
                
                 if response.status_code == 200:
                     result = response.json()
@@ -1474,9 +3743,8 @@ if __name__ == "__main__":
        
         def validate_sso_token_with_backend(token):
             try:
-                session = get_requests_session()
                 headers = {"Authorization": f"Bearer {token}"}
-                response = session.get(f"{API_BASE_URL}/sso/validate-token", headers=headers, timeout=60)
+                response = api_request("GET", "/sso/validate-token", headers=headers)
                 if response.status_code == 200:
                     return True, response.json()
                 else:
@@ -1616,8 +3884,9 @@ if __name__ == "__main__":
                
                 print(f"Final feedback payload: {feedback_payload}")
                
-                response = requests.post(
-                    f"{API_BASE_URL}/chatbot/feedback",
+                response = api_request(
+                    "POST",
+                    "/chatbot/feedback",
                     json=feedback_payload,
                     headers=headers,
                     timeout=30
@@ -1649,16 +3918,47 @@ if __name__ == "__main__":
                 print(f"Unexpected error: {e}")
  
    
-        # Validate SSO token with backend
-        token = st.session_state["access_token"]
-        if token:
-            token_valid = validate_user(token)
-            if not token_valid:
-                st.error("SSO token validation failed. Please refresh and login again.")
-                st.session_state["access_token"] = None
-                st.session_state["authenticated"] = False
-                login()
- 
+        # Polls the in-flight chat request without blocking the rest of the page
+        @st.fragment(run_every=CHAT_POLL_INTERVAL)
+        def render_pending_chat():
+            chat_request = st.session_state.get("pending_chat")
+            if chat_request is None:
+                return
+
+            if not chat_request.future.done():
+                with st.chat_message("assistant"):
+                    if chat_request.partial_answer:
+                        st.markdown(chat_request.partial_answer + "▌")
+                    else:
+                        st.markdown(f"⏳ *ARB Chatbot is Generating Response...* ({chat_request.elapsed:.0f}s)")
+                    if st.button("⏹️ Cancel", key=f"cancel_chat_{chat_request.request_key}"):
+                        chat_request.cancel()
+                        st.session_state.pending_chat = None
+                        st.session_state.chat_notice = ("cancelled", "Request cancelled.")
+                        st.rerun()
+                return
+
+            st.session_state.pending_chat = None
+            if chat_request.stream_unsupported:
+                st.session_state["chat_stream_unsupported"] = True
+            status, payload = chat_request.future.result()
+            if status == "ok":
+                result_json, response_id, chat_history_id = parse_chat_result(payload)
+                st.session_state.messages.append({
+                    "role": "assistant",
+                    "content": result_json,
+                    "timestamp": datetime.now().strftime("%H:%M:%S"),
+                    "response_id": response_id,
+                    "chat_history_id": chat_history_id,
+                    "session_id": st.session_state.session_id
+                })
+                optimize_message_history()
+            elif status != "cancelled":
+                st.session_state.chat_notice = (status, payload)
+            st.rerun()
+
+        render_profiler.checkpoint("session_setup")
+
         # Only show chat content when in chat mode
         if st.session_state.current_mode == 'chat':
             # Chat content area
@@ -1671,14 +3971,7 @@ if __name__ == "__main__":
                         if message["role"] == "assistant":
                             result_json = message["content"]
                             st.markdown(result_json.get("answer"))
-                            if len(result_json.get("citation")) > 0:
-                                st.markdown("---")
-                                st.markdown("**Citations:**")
-                                st.markdown("\n".join([f"- [Reference {i+1}]({citation})" for i, citation in enumerate(result_json.get("citation"))]))
-                            if len(result_json.get("follow_up")) > 0:
-                                st.markdown("---")
-                                st.markdown("**Follow Up:**")
-                                st.markdown("\n".join([f"{i+1}. {follow} " for i, follow in enumerate(result_json.get("follow_up"))]))
+                            render_chat_extras(result_json)
                         else:
                             st.markdown(message['content'])
                         if "timestamp" in message:
@@ -1686,10 +3979,26 @@ if __name__ == "__main__":
                        
                         # Feedback UI for assistant messages
                         if message["role"] == "assistant":
-                            render_feedback_ui(
-                                message_id=f"msg_{i}",
-                                message_index=i
-                            )
+                            with render_profiler.section("feedback_ui"):
+                                render_feedback_ui(
+                                    message_id=f"msg_{i}",
+                                    message_index=i
+                                )
+                render_profiler.checkpoint("chat_history")
+
+                # Outcome of the last background chat request that did not produce an answer
+                chat_notice = st.session_state.pop("chat_notice", None)
+                if chat_notice:
+                    notice_level, notice_text = chat_notice
+                    if notice_level == "warning":
+                        st.warning(notice_text)
+                    elif notice_level == "cancelled":
+                        st.info(notice_text)
+                    else:
+                        st.error(notice_text)
+
+                if st.session_state.get("pending_chat") is not None:
+                    render_pending_chat()
 
             # Chat input only in chat mode
             if st.session_state.current_mode == 'chat':
@@ -1697,14 +4006,25 @@ if __name__ == "__main__":
                     st.session_state["input_text"] = ""
                 st.toast("Welcome..!!")
                 
-                prompt = st.chat_input("What's on your mind?") or st.session_state["input_text"]
+                # One question in flight per session; FAQ clicks wait in input_text until it finishes
+                chat_busy = st.session_state.get("pending_chat") is not None
+                prompt = st.chat_input("What's on your mind?", disabled=chat_busy)
+                if not prompt and not chat_busy:
+                    prompt = st.session_state["input_text"]
                 if prompt:
                     st.session_state["input_text"] = ""
 
-                    if not test_api_connection()[0]:
+                    # Trust a cached healthy status; only re-probe when it says offline
+                    health_monitor = get_health_monitor()
+                    if not health_monitor.status()["is_connected"] and not health_monitor.probe()[0]:
                         st.error("Cannot connect to ARB Chatbot API.")
                         st.stop()
 
+                    token = st.session_state["access_token"]
+                    if not token:
+                        st.error("Session expired. Please log in again.")
+                        st.stop()
+
                     # Add user message to session state
                     user_message = {
                         "role": "user",
@@ -1714,100 +4034,24 @@ if __name__ == "__main__":
                     }
                     st.session_state.messages.append(user_message)
                     optimize_message_history()
-                    with st.chat_message("user"):
-                        st.markdown(prompt)
-                        st.caption(f"*{user_message['timestamp']}*")
-
-                    # Get response from API
-                    with st.chat_message("assistant"):
-                        message_placeholder = st.empty()
 
-                        with st.spinner("ARB Chatbot is Generating Response..."):
-                            try:
-                                token = st.session_state["access_token"]
-                                if not token:
-                                    st.error("Session expired. Please log in again.")
-                                    st.stop()
-
-                                headers = {"Authorization": f"Bearer {token}", "Content-Type": "application/json"}
-                                request_data = {
-                                    "message": prompt,
-                                    "session_id": st.session_state.session_id['session_id']
-                                }
-
-                                session = get_requests_session()
-                                response = session.post(
-                                    f"{API_BASE_URL}/chat",
-                                    json=request_data,
-                                    timeout=120,
-                                    headers=headers
-                                )
-
-                                if response.status_code == 200:
-                                    result = response.json()
-                                    result_json = None
-                                    try:
-                                        result_json = json.loads(result["response"])
-                                    except:
-                                        result_json = {"answer": result["response"],
-                                                       "citation": [],
-                                                       "follow_up": []}
-
-                                    assistant_response = result_json["answer"]
-                                    response_id = result.get("request_id") or result.get("response_id")
-                                    chat_history_id = result.get("chat_history_id")
-
-                                    if not response_id:
-                                        response_id = str(uuid.uuid4())
-
-                                    message_placeholder.empty()
-                                    st.markdown(assistant_response)
-                                    if len(result_json.get("citation")) > 0:
-                                        st.markdown("---")
-                                        st.markdown("**Citations:**")
-                                        st.markdown("\n".join([f"- [Reference {i+1}]({citation})" for i, citation in enumerate(result_json.get("citation"))]))
-                                    if len(result_json.get("follow_up")) > 0:
-                                        st.markdown("---")
-                                        st.markdown("**Follow Up:**")
-                                        st.markdown("\n".join([f"{i+1}. {follow} " for i, follow in enumerate(result_json.get("follow_up"))]))
-
-                                    assistant_message = {
-                                        "role": "assistant",
-                                        "content": result_json,
-                                        "timestamp": datetime.now().strftime("%H:%M:%S"),
-                                        "response_id": response_id,
-                                        "chat_history_id": chat_history_id,
-                                        "session_id": st.session_state.session_id
-                                    }
-                                    st.session_state.messages.append(assistant_message)
-                                    st.caption(f"*{assistant_message['timestamp']}*")
-
-                                    message_id = f"msg_{len(st.session_state.messages) - 1}"
-                                    render_feedback_ui(
-                                        message_id=message_id,
-                                        message_index=len(st.session_state.messages) - 1
-                                    )
-
-                                elif response.status_code == 429:
-                                    message_placeholder.error("Rate limit exceeded. Please wait before sending another message.")
-                                elif response.status_code == 503:
-                                    message_placeholder.warning("ARB Chatbot Server busy. Request queued for processing.")
-                                else:
-                                    error_detail = response.text
-                                    try:
-                                        error_json = response.json()
-                                        error_detail = error_json.get("detail", error_detail)
-                                    except:
-                                        pass
-                                    message_placeholder.error(f"Error {response.status_code}: {error_detail}. Please refresh the page and try again.")
-
-                            except requests.exceptions.Timeout:
-                                message_placeholder.error("Request timed out after 120 seconds. Please re-submit your query.")
-                            except requests.exceptions.ConnectionError:
-                                message_placeholder.error("Connection error. Is the FastAPI server running on port 8000?")
-                            except requests.exceptions.RequestException as e:
-                                message_placeholder.error(f"Request error: {str(e)}")
+                    # Hand the request to a chat worker and keep only the handle, so
+                    # the script thread is free to rerender while the answer is generated
+                    headers = {"Authorization": f"Bearer {token}", "Content-Type": "application/json"}
+                    request_data = {
+                        "message": prompt,
+                        "session_id": st.session_state.session_id['session_id']
+                    }
+                    use_stream = CHAT_STREAMING and not st.session_state.get("chat_stream_unsupported")
+                    chat_request = ChatRequest(prompt)
+                    chat_request.future = get_chat_executor().submit(
+                        run_chat_request, chat_request, request_data, headers, use_stream
+                    )
+                    st.session_state.pending_chat = chat_request
+                    st.rerun()
  
+        render_profiler.checkpoint("chat_input")
+
         #Sidebar with only FAQs and Feedback
         with st.sidebar:
             st.markdown("""
@@ -1827,6 +4071,7 @@ if __name__ == "__main__":
            
             with col2:
                 if st.button("📈 Overall Stats", use_container_width=True):
+                    get_feedback_stats.clear()
                     st.session_state['feedback_stats'] = None
                     st.rerun()
            
@@ -1838,6 +4083,7 @@ if __name__ == "__main__":
                     if success:
                         st.session_state['feedback_stats'] = stats
                 if st.session_state["feedback_stats"]:
+                    stats = st.session_state["feedback_stats"]
                     # Statistics cards
                     st.markdown("### Quick Stats")
                    
@@ -1885,11 +4131,14 @@ if __name__ == "__main__":
                             st.write(f"👍 **Helpful:** {'Yes' if feedback.get('is_helpful') else 'No' if feedback.get('is_helpful') is False else 'N/A'}")
                             if feedback.get('feedback_text'):
                                 st.write(f"💬 **Comment:** {feedback['feedback_text'][:100]}{'...' if len(feedback.get('feedback_text', '')) > 100 else ''}")
-                elif success:
+                elif st.session_state['feedback'] is not None:
                     st.info("💡 No feedback history yet. Start giving feedback to see your history here!")
             except Exception as e:
                 st.warning("Feedback history temporarily unavailable")
+        render_profiler.checkpoint("sidebar_stats")
  
         # Footer
         st.markdown("---")
-        st.markdown("**GSC ARB Chatbot** - Team ARB")
\ No newline at end of file
+        st.markdown("**GSC ARB Chatbot** - Team ARB")
+        render_profiler.checkpoint("footer")
+        render_profiler.finish_run()
\ No newline at end of file